@@ -41,6 +41,29 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# 드라이버가 지정되지 않은 PostgreSQL URL scheme (database/session.py와 동일)
+_SYNC_POSTGRES_PREFIXES = ("postgresql://", "postgres://")
+
+
+def _migration_url(driver: str = "") -> str:
+    """POSTGRES_URL을 SQLAlchemy가 인식하는 scheme으로 정규화
+
+    Args:
+        driver: 사용할 드라이버 (예: "psycopg"). 비어 있으면 기본 드라이버
+
+    Returns:
+        postgresql[+driver]:// 형식의 URL
+    """
+    url = os.getenv("POSTGRES_URL")
+    if not url:
+        raise ValueError("POSTGRES_URL 환경 변수가 설정되지 않았습니다.")
+
+    # SQLAlchemy는 postgres:// scheme을 지원하지 않으므로 scheme 재구성
+    if url.startswith(_SYNC_POSTGRES_PREFIXES):
+        scheme = f"postgresql+{driver}" if driver else "postgresql"
+        url = f"{scheme}://" + url.split("://", 1)[1]
+    return url
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -54,9 +77,7 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = os.getenv("POSTGRES_URL")
-    if not url:
-        raise ValueError("POSTGRES_URL 환경 변수가 설정되지 않았습니다.")
+    url = _migration_url()
 
     context.configure(
         url=url,
@@ -76,13 +97,8 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    url = os.getenv("POSTGRES_URL")
-    if not url:
-        raise ValueError("POSTGRES_URL 환경 변수가 설정되지 않았습니다.")
-
     # Use psycopg (v3) driver for synchronous migrations
-    if url.startswith("postgresql://"):
-        url = url.replace("postgresql://", "postgresql+psycopg://", 1)
+    url = _migration_url("psycopg")
 
     connectable = create_engine(url, poolclass=pool.NullPool)
 
@@ -3,7 +3,7 @@
 Phase 2: Agent 관리 API (2025-11-06)
 사용 가능한 Agent 목록 조회
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from fastapi import APIRouter
 from pydantic import BaseModel
 
@@ -27,6 +27,56 @@ class AgentListResponse(BaseModel):
     total: int
 
 
+# === Agent Catalog ===
+
+# 현재는 하드코딩된 Agent 목록 (요청마다 새로 만들지 않도록 모듈 로드 시 한 번 생성)
+# TODO: Agent Registry에서 동적으로 조회
+AGENT_CATALOG: Tuple[AgentInfo, ...] = (
+    AgentInfo(
+        name="DietAgent",
+        description="식단 및 영양 관리 Agent",
+        capabilities=[
+            "meal_planning",
+            "calorie_calculation",
+            "nutrition_analysis",
+            "allergy_check"
+        ],
+        status="available"
+    ),
+    AgentInfo(
+        name="WorkoutAgent",
+        description="운동 프로그램 생성 Agent",
+        capabilities=[
+            "workout_planning",
+            "exercise_recommendation",
+            "fitness_assessment",
+            "progress_tracking"
+        ],
+        status="available"
+    ),
+    AgentInfo(
+        name="HealthAssessmentAgent",
+        description="건강 상태 평가 Agent",
+        capabilities=[
+            "health_check",
+            "risk_assessment",
+            "medical_history_analysis"
+        ],
+        status="available"
+    ),
+    AgentInfo(
+        name="ReportAgent",
+        description="보고서 생성 Agent",
+        capabilities=[
+            "report_generation",
+            "data_visualization",
+            "summary_creation"
+        ],
+        status="available"
+    )
+)
+
+
 # === Agent Management Endpoints ===
 
 @router.get("", response_model=AgentListResponse)
@@ -40,54 +90,7 @@ async def list_agents():
         현재는 하드코딩된 Agent 목록을 반환합니다.
         향후 Agent Registry에서 동적으로 조회하도록 개선 예정
     """
-    # TODO: Agent Registry에서 동적으로 조회
-    # 현재는 하드코딩된 목록 반환
-    agents = [
-        AgentInfo(
-            name="DietAgent",
-            description="식단 및 영양 관리 Agent",
-            capabilities=[
-                "meal_planning",
-                "calorie_calculation",
-                "nutrition_analysis",
-                "allergy_check"
-            ],
-            status="available"
-        ),
-        AgentInfo(
-            name="WorkoutAgent",
-            description="운동 프로그램 생성 Agent",
-            capabilities=[
-                "workout_planning",
-                "exercise_recommendation",
-                "fitness_assessment",
-                "progress_tracking"
-            ],
-            status="available"
-        ),
-        AgentInfo(
-            name="HealthAssessmentAgent",
-            description="건강 상태 평가 Agent",
-            capabilities=[
-                "health_check",
-                "risk_assessment",
-                "medical_history_analysis"
-            ],
-            status="available"
-        ),
-        AgentInfo(
-            name="ReportAgent",
-            description="보고서 생성 Agent",
-            capabilities=[
-                "report_generation",
-                "data_visualization",
-                "summary_creation"
-            ],
-            status="available"
-        )
-    ]
-
     return AgentListResponse(
-        agents=agents,
-        total=len(agents)
+        agents=list(AGENT_CATALOG),
+        total=len(AGENT_CATALOG)
     )
@@ -300,9 +300,9 @@ async def list_checkpoints(thread_id: str):
 
         step = 0
         async for checkpoint_tuple in checkpoint_tuples:
-            checkpoint_config = checkpoint_tuple.config
-            checkpoint_id = checkpoint_config.get("configurable", {}).get("checkpoint_id", "")
-            checkpoint_ns = checkpoint_config.get("configurable", {}).get("checkpoint_ns", "")
+            configurable = checkpoint_tuple.config.get("configurable") or {}
+            checkpoint_id = configurable.get("checkpoint_id", "")
+            checkpoint_ns = configurable.get("checkpoint_ns", "")
 
             checkpoints.append(CheckpointInfo(
                 checkpoint_id=str(checkpoint_id),
@@ -16,6 +16,20 @@ from backend.app.octostrator.session import create_session, get_session_config
 from backend.app.octostrator.contexts.app_context import create_app_context, UserTier
 from backend.app.config.llm_settings import get_llm_settings_for_user
 
+# 스트리밍 메시지 직렬화: orjson이 설치되어 있으면 사용 (C 구현, 표준 json보다 빠름)
+try:
+    import orjson
+
+    def _dumps(message: dict) -> str:
+        return orjson.dumps(message).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(message: dict) -> str:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+    _loads = json.loads
+
 
 router = APIRouter()
 
@@ -75,7 +89,7 @@ class ConnectionManager:
         if session_id in self.active_connections:
             websocket = self.active_connections[session_id]
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(_dumps(message))
             except Exception as e:
                 log_with_timestamp(f"[WebSocket] Failed to send message to {session_id}: {e}")
                 self.disconnect(session_id)
@@ -172,7 +186,7 @@ async def websocket_chat(websocket: WebSocket, session_id: str):
         # 메시지 수신 루프
         while True:
             # 클라이언트 메시지 대기
-            data = await websocket.receive_json()
+            data = _loads(await websocket.receive_text())
 
             # 메시지 검증
             if "message" not in data:
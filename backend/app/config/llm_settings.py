@@ -29,7 +29,9 @@ Usage:
 """
 import os
 from enum import Enum
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping, Optional, Dict, Any
 
 from backend.app.octostrator.contexts.app_context import LLMSettings, UserTier
 
@@ -44,8 +46,10 @@ class Environment(str, Enum):
 # ==========================================
 # Environment-Specific Presets
 # ==========================================
+# Preset은 읽기 전용 (MappingProxyType). 기본 LLMSettings는 preset별로 캐싱되어
+# 모든 요청이 공유하므로 LLMSettings 자체도 frozen입니다. 변경 대신 overrides 인자를 사용하세요.
 
-PRODUCTION_PRESET = {
+PRODUCTION_PRESET: Final[Mapping[str, Any]] = MappingProxyType({
     # Model
     "default_model": "gpt-4o-mini",
 
@@ -83,9 +87,9 @@ PRODUCTION_PRESET = {
     "agent_temperature": 0.4,
     "agent_max_tokens": 3500,
     "agent_model": "gpt-4o-mini",
-}
+})
 
-DEVELOPMENT_PRESET = {
+DEVELOPMENT_PRESET: Final[Mapping[str, Any]] = MappingProxyType({
     # Model
     "default_model": "gpt-4o-mini",
 
@@ -123,9 +127,9 @@ DEVELOPMENT_PRESET = {
     "agent_temperature": 0.5,
     "agent_max_tokens": 5000,
     "agent_model": "gpt-4o-mini",
-}
+})
 
-TESTING_PRESET = {
+TESTING_PRESET: Final[Mapping[str, Any]] = MappingProxyType({
     # Model
     "default_model": "gpt-4o-mini",
 
@@ -158,7 +162,7 @@ TESTING_PRESET = {
     "agent_temperature": 0.0,
     "agent_max_tokens": 1024,
     "agent_model": "gpt-4o-mini",
-}
+})
 
 
 # ==========================================
@@ -166,7 +170,7 @@ TESTING_PRESET = {
 # ==========================================
 
 # Premium 사용자: 최고 품질 모델, 많은 토큰
-PREMIUM_PRESET = {
+PREMIUM_PRESET: Final[Mapping[str, Any]] = MappingProxyType({
     # Model
     "default_model": "gpt-4o",
 
@@ -204,13 +208,13 @@ PREMIUM_PRESET = {
     "agent_temperature": 0.5,
     "agent_max_tokens": 8000,
     "agent_model": "gpt-4o",
-}
+})
 
 # Standard 사용자: 균형잡힌 설정 (Development와 동일)
-STANDARD_PRESET = DEVELOPMENT_PRESET.copy()
+STANDARD_PRESET: Final[Mapping[str, Any]] = DEVELOPMENT_PRESET
 
 # Trial 사용자: 비용 최소화, 적은 토큰
-TRIAL_PRESET = {
+TRIAL_PRESET: Final[Mapping[str, Any]] = MappingProxyType({
     # Model
     "default_model": "gpt-4o-mini",
 
@@ -248,7 +252,7 @@ TRIAL_PRESET = {
     "agent_temperature": 0.4,
     "agent_max_tokens": 2000,
     "agent_model": "gpt-4o-mini",
-}
+})
 
 
 # ==========================================
@@ -287,20 +291,11 @@ def get_llm_settings(
         >>> settings.chat_max_tokens
         5000
     """
-    # 환경별 preset 선택
-    if environment == Environment.PRODUCTION:
-        preset = PRODUCTION_PRESET.copy()
-    elif environment == Environment.TESTING:
-        preset = TESTING_PRESET.copy()
-    else:
-        preset = DEVELOPMENT_PRESET.copy()
+    # overrides가 없으면 환경별로 한 번만 검증한 인스턴스 재사용
+    if not overrides:
+        return _environment_settings(environment)
 
-    # 선택적 overrides 적용
-    if overrides:
-        preset.update(overrides)
-
-    # LLMSettings 인스턴스 생성 (Pydantic 검증)
-    return LLMSettings(**preset)
+    return _build_settings(_environment_preset(environment), overrides)
 
 
 def get_llm_settings_from_env() -> LLMSettings:
@@ -362,22 +357,54 @@ def get_llm_settings_for_user(
         >>> settings.chat_max_tokens
         10000
     """
-    # 사용자 Tier별 preset 선택
+    # overrides가 없으면 Tier별로 한 번만 검증한 인스턴스 재사용
+    # (WebSocket 메시지마다 호출되므로 매번 Pydantic 검증하지 않음)
+    if not overrides:
+        return _tier_settings(user_tier)
+
+    return _build_settings(_tier_preset(user_tier), overrides)
+
+
+def _environment_preset(environment: Environment) -> Mapping[str, Any]:
+    """환경별 preset 선택"""
+    if environment == Environment.PRODUCTION:
+        return PRODUCTION_PRESET
+    if environment == Environment.TESTING:
+        return TESTING_PRESET
+    return DEVELOPMENT_PRESET
+
+
+def _tier_preset(user_tier: UserTier) -> Mapping[str, Any]:
+    """사용자 Tier별 preset 선택"""
     if user_tier == UserTier.PREMIUM:
-        preset = PREMIUM_PRESET.copy()
-    elif user_tier == UserTier.TRIAL:
-        preset = TRIAL_PRESET.copy()
-    else:
-        preset = STANDARD_PRESET.copy()
+        return PREMIUM_PRESET
+    if user_tier == UserTier.TRIAL:
+        return TRIAL_PRESET
+    return STANDARD_PRESET
 
-    # 선택적 overrides 적용
-    if overrides:
-        preset.update(overrides)
 
-    # LLMSettings 인스턴스 생성 (Pydantic 검증)
+def _build_settings(
+    preset: Mapping[str, Any],
+    overrides: Optional[Dict[str, Any]] = None
+) -> LLMSettings:
+    """preset에 overrides를 적용하여 LLMSettings 생성 (Pydantic 검증)"""
+    if overrides:
+        preset = {**preset, **overrides}
     return LLMSettings(**preset)
 
 
+@lru_cache(maxsize=None)
+def _environment_settings(environment: Environment) -> LLMSettings:
+    """환경별 기본 LLMSettings (캐싱)"""
+    return _build_settings(_environment_preset(environment))
+
+
+@lru_cache(maxsize=None)
+def _tier_settings(user_tier: UserTier) -> LLMSettings:
+    """사용자 Tier별 기본 LLMSettings (캐싱)"""
+    return _build_settings(_tier_preset(user_tier))
+
+
 # ==========================================
 # Token Cost Estimation
 # ==========================================
@@ -3,22 +3,63 @@
 Phase 4.1: AsyncPostgresSaver 초기화 및 관리
 CheckpointerManager 패턴을 사용하여 연결 생명주기 관리
 """
+import asyncio
 import os
-from typing import Optional, Dict
+import threading
+import weakref
+from typing import Optional, Dict, Set
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
+# 이 프로세스에서 setup()(테이블 생성/마이그레이션)을 이미 마친 연결 문자열
+_schema_initialized: Set[str] = set()
+
+
+class _LoopCheckpointers:
+    """이벤트 루프 하나에 묶인 checkpointer 캐시"""
+
+    __slots__ = ("checkpointers", "context_managers", "create_lock")
+
+    def __init__(self):
+        self.checkpointers: Dict[str, AsyncPostgresSaver] = {}
+        self.context_managers: Dict[str, object] = {}
+        # 동시 첫 요청에서 setup()이 중복 실행되지 않도록 생성 경로 보호
+        # (asyncio.Lock도 루프에 묶이므로 루프별로 생성)
+        self.create_lock = asyncio.Lock()
+
 
 class CheckpointerManager:
     """AsyncPostgresSaver 연결 생명주기 관리
 
     Context manager와 checkpointer 인스턴스를 모두 캐싱하여
     연결이 닫히지 않도록 유지합니다.
+
+    AsyncPostgresSaver는 진입한 이벤트 루프에 묶이므로 캐시는
+    이벤트 루프 객체 -> {연결 문자열: checkpointer} 구조입니다.
+    id(loop)는 루프가 수거된 뒤 재사용될 수 있으므로 루프 객체 자체를 키로 씁니다.
     """
 
     def __init__(self):
         """CheckpointerManager 초기화"""
-        self._checkpointers: Dict[str, AsyncPostgresSaver] = {}
-        self._context_managers: Dict[str, object] = {}
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopCheckpointers]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # 기본 연결 문자열은 한 번만 읽음 (환경 변수 변경 시 refresh() 호출)
+        self._conn_string: Optional[str] = os.getenv("POSTGRES_URL")
+
+    def refresh(self):
+        """POSTGRES_URL 환경 변수를 다시 읽기"""
+        self._conn_string = os.getenv("POSTGRES_URL")
+
+    def _evict_closed_loops(self):
+        """닫힌 이벤트 루프의 캐시 제거
+
+        캐시된 연결/락이 루프를 참조하므로 weakref만으로는 수거되지 않습니다.
+        닫힌 루프의 연결은 다른 루프에서 닫을 수 없으므로 참조만 버립니다.
+        """
+        for loop in [loop for loop in self._loops if loop.is_closed()]:
+            entry = self._loops.pop(loop)
+            for conn_string in entry.checkpointers:
+                print(f"[CheckpointerManager] 닫힌 이벤트 루프의 Checkpointer 제거: {conn_string}")
 
     async def create_checkpointer(
         self,
@@ -37,7 +78,7 @@ class CheckpointerManager:
         """
         # 연결 문자열 가져오기
         if conn_string is None:
-            conn_string = os.getenv("POSTGRES_URL")
+            conn_string = self._conn_string
 
         if not conn_string:
             raise ValueError(
@@ -45,79 +86,95 @@ class CheckpointerManager:
                 ".env 파일을 확인하세요."
             )
 
+        loop = asyncio.get_running_loop()
+        entry = self._loops.get(loop)
+        if entry is None:
+            self._evict_closed_loops()
+            entry = self._loops[loop] = _LoopCheckpointers()
+
         # 이미 캐시된 checkpointer가 있으면 반환
-        if conn_string in self._checkpointers:
+        if conn_string in entry.checkpointers:
             print(f"[CheckpointerManager] ✓ 캐시된 Checkpointer 반환: {conn_string}")
-            return self._checkpointers[conn_string]
+            return entry.checkpointers[conn_string]
+
+        async with entry.create_lock:
+            # 대기 중 다른 요청이 먼저 생성했을 수 있으므로 재확인
+            if conn_string in entry.checkpointers:
+                return entry.checkpointers[conn_string]
 
-        print(f"[CheckpointerManager] 새 Checkpointer 생성 중: {conn_string}")
+            print(f"[CheckpointerManager] 새 Checkpointer 생성 중: {conn_string}")
 
-        # AsyncPostgresSaver.from_conn_string()은 async context manager를 반환
-        # 연결을 유지하려면 context manager를 명시적으로 enter하고 캐싱해야 함
-        context_manager = AsyncPostgresSaver.from_conn_string(conn_string)
+            # AsyncPostgresSaver.from_conn_string()은 async context manager를 반환
+            # 연결을 유지하려면 context manager를 명시적으로 enter하고 캐싱해야 함
+            context_manager = AsyncPostgresSaver.from_conn_string(conn_string)
 
-        # Async context manager에 진입
-        actual_checkpointer = await context_manager.__aenter__()
+            # Async context manager에 진입
+            actual_checkpointer = await context_manager.__aenter__()
 
-        # PostgreSQL 테이블 생성
-        print("[CheckpointerManager] Checkpoint 테이블 생성/확인 중...")
-        await actual_checkpointer.setup()
-        print("[CheckpointerManager] ✓ Checkpoint 테이블 생성/확인 완료")
+            # PostgreSQL 테이블 생성 (같은 DB에 대해 프로세스당 한 번만)
+            if conn_string not in _schema_initialized:
+                print("[CheckpointerManager] Checkpoint 테이블 생성/확인 중...")
+                await actual_checkpointer.setup()
+                _schema_initialized.add(conn_string)
+                print("[CheckpointerManager] ✓ Checkpoint 테이블 생성/확인 완료")
 
-        # 중요: checkpointer와 context manager를 모두 캐싱
-        # context manager를 유지해야 연결이 닫히지 않음
-        self._checkpointers[conn_string] = actual_checkpointer
-        self._context_managers[conn_string] = context_manager
+            # 중요: checkpointer와 context manager를 모두 캐싱
+            # context manager를 유지해야 연결이 닫히지 않음
+            entry.checkpointers[conn_string] = actual_checkpointer
+            entry.context_managers[conn_string] = context_manager
 
-        print("[CheckpointerManager] ✓ Checkpointer 생성 및 캐싱 완료")
+            print("[CheckpointerManager] ✓ Checkpointer 생성 및 캐싱 완료")
 
-        return actual_checkpointer
+            return actual_checkpointer
 
     async def close_checkpointer(self, conn_string: Optional[str] = None):
-        """특정 checkpointer와 연결을 닫기
+        """현재 이벤트 루프의 특정 checkpointer와 연결을 닫기
 
         Args:
             conn_string: PostgreSQL 연결 문자열. None이면 POSTGRES_URL 환경변수 사용
         """
         if conn_string is None:
-            conn_string = os.getenv("POSTGRES_URL")
+            conn_string = self._conn_string
 
         if not conn_string:
             return
 
-        if conn_string in self._context_managers:
-            context_manager = self._context_managers[conn_string]
-
-            # Context manager 정상 종료
-            await context_manager.__aexit__(None, None, None)
+        entry = self._loops.get(asyncio.get_running_loop())
+        if entry is None or conn_string not in entry.context_managers:
+            return
 
-            # 캐시에서 제거
-            self._context_managers.pop(conn_string, None)
-            self._checkpointers.pop(conn_string, None)
+        # 캐시에서 제거 후 Context manager 정상 종료
+        context_manager = entry.context_managers.pop(conn_string)
+        entry.checkpointers.pop(conn_string, None)
+        await context_manager.__aexit__(None, None, None)
 
-            print(f"[CheckpointerManager] ✓ Checkpointer 연결 종료: {conn_string}")
+        print(f"[CheckpointerManager] ✓ Checkpointer 연결 종료: {conn_string}")
 
     async def close_all(self):
-        """모든 checkpointer 연결 닫기"""
+        """현재 이벤트 루프의 모든 checkpointer 연결 닫기
+
+        다른 루프에 묶인 연결은 그 루프에서 close_all()을 호출해야 닫힙니다.
+        (닫힌 루프의 캐시는 다음 생성 시 제거됨)
+        """
         print("[CheckpointerManager] 모든 Checkpointer 연결 종료 중...")
 
-        # 모든 context manager 종료
-        for conn_string, context_manager in list(self._context_managers.items()):
-            try:
-                await context_manager.__aexit__(None, None, None)
-                print(f"[CheckpointerManager] ✓ 연결 종료: {conn_string}")
-            except Exception as e:
-                print(f"[CheckpointerManager] ⚠ 연결 종료 실패: {conn_string} - {e}")
+        entry = self._loops.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            for conn_string, context_manager in entry.context_managers.items():
+                try:
+                    await context_manager.__aexit__(None, None, None)
+                    print(f"[CheckpointerManager] ✓ 연결 종료: {conn_string}")
+                except Exception as e:
+                    print(f"[CheckpointerManager] ⚠ 연결 종료 실패: {conn_string} - {e}")
 
-        # 캐시 초기화
-        self._checkpointers.clear()
-        self._context_managers.clear()
+        self._evict_closed_loops()
 
         print("[CheckpointerManager] ✓ 모든 연결 종료 완료")
 
 
 # 전역 CheckpointerManager 인스턴스 (싱글톤)
 _checkpointer_manager: Optional[CheckpointerManager] = None
+_checkpointer_manager_lock = threading.Lock()
 
 
 def get_checkpointer_manager() -> CheckpointerManager:
@@ -129,8 +186,10 @@ def get_checkpointer_manager() -> CheckpointerManager:
     global _checkpointer_manager
 
     if _checkpointer_manager is None:
-        _checkpointer_manager = CheckpointerManager()
-        print("[CheckpointerManager] ✓ 새 CheckpointerManager 인스턴스 생성")
+        with _checkpointer_manager_lock:
+            if _checkpointer_manager is None:
+                _checkpointer_manager = CheckpointerManager()
+                print("[CheckpointerManager] ✓ 새 CheckpointerManager 인스턴스 생성")
 
     return _checkpointer_manager
 
@@ -24,8 +24,9 @@ Phase 3 Updates:
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from enum import Enum
-import uuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.app.utils.id_pool import pool_uuid4
 
 
 # ==========================================
@@ -47,8 +48,13 @@ class LLMSettings(BaseModel):
     - chat_generator: 자연스러운 대화 (temp 0.7, tokens 4096)
     - graph_generator: JSON 정확성 (temp 0.2, tokens 2048)
     - report_generator: 긴 보고서 생성 (temp 0.5, tokens 8192)
+
+    기본 설정 인스턴스는 환경/Tier별로 캐싱되어 모든 요청이 공유하므로 불변입니다.
+    값을 바꾸려면 get_llm_settings(..., overrides=...) 또는 model_copy(update=...)를 사용하세요.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # Model Selection
     default_model: str = Field(default="gpt-4o-mini", description="기본 LLM 모델")
 
@@ -109,7 +115,7 @@ class UserTier(str, Enum):
 # Application Context
 # ==========================================
 
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     """Application 런타임 Context
 
@@ -129,6 +135,8 @@ class AppContext:
     - session_id: 세션 ID
     - llm_settings: 노드별 LLM 설정 (Phase 2 신규)
     - db_conn: DB 연결 (Phase 5에서 추가 예정)
+
+    slots=True: 요청마다 생성되므로 인스턴스 __dict__ 없이 필드만 보관
     """
 
     # 사용자 정보
@@ -143,7 +151,7 @@ class AppContext:
     debug: bool = False
 
     # 분산 추적 ID (요청 추적용)
-    trace_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    trace_id: str = field(default_factory=pool_uuid4)
 
     # 메트릭 수집 (성능 추적)
     metrics: Dict[str, Any] = field(default_factory=dict)
@@ -241,7 +249,7 @@ def create_app_context(
 
     # Trace ID 자동 생성
     if trace_id is None:
-        trace_id = str(uuid.uuid4())
+        trace_id = pool_uuid4()
 
     # Debug 모드에 따른 log_level 설정
     log_level = "DEBUG" if debug else "INFO"
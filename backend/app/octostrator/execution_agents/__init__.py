@@ -6,8 +6,10 @@ Agent Registry will be populated as agents are implemented.
 """
 
 # Import agent registry
-from .base.agent_registry import agent_registry
+from .base.agent_registry import agent_registry, agent_scope, get_agent_registry
 
 __all__ = [
     "agent_registry",
+    "agent_scope",
+    "get_agent_registry",
 ]
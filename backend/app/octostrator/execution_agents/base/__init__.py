@@ -4,7 +4,7 @@
 """
 
 from .base_agent import BaseAgent, BaseAgentState, AgentStatus, AgentPriority
-from .agent_registry import AgentRegistry, agent_registry, register_agent
+from .agent_registry import AgentRegistry, agent_registry, agent_scope, get_agent_registry, register_agent
 from .checkpoint_strategy import CheckpointStrategy, CheckpointMode, get_checkpoint_strategy
 from .dependency_resolver import DependencyResolver, DependencyStatus, ExecutionPlan, get_dependency_resolver
 
@@ -18,6 +18,8 @@ __all__ = [
     # Registry
     "AgentRegistry",
     "agent_registry",
+    "agent_scope",
+    "get_agent_registry",
     "register_agent",
 
     # Checkpoint Strategy
@@ -4,8 +4,18 @@
 10+ Agent를 효율적으로 관리하고 검색합니다.
 """
 
+import asyncio
+import bisect
+import heapq
 import logging
-from typing import Dict, List, Optional, Type, Any
+import math
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Any
 from pathlib import Path
 import importlib
 import inspect
@@ -14,6 +24,24 @@ from .base_agent import BaseAgent, AgentStatus, AgentPriority
 
 logger = logging.getLogger(__name__)
 
+# 검색용 토큰 추출 (snake_case 능력명은 "_" 기준으로 분리됨)
+_TOKEN_RE = re.compile(r"[0-9a-z가-힣]+")
+
+# BM25 파라미터
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+@dataclass(slots=True, frozen=True)
+class AgentMetadata:
+    """색인 시점의 Agent 인스턴스 메타데이터
+
+    역색인에서 제거할 때 인스턴스 속성이 아닌 이 스냅샷을 기준으로 합니다.
+    """
+    capabilities: Tuple[str, ...]
+    tokens: Tuple[str, ...]
+    priority: int
+
 
 class AgentRegistry:
     """Agent Registry for Dynamic Agent Management
@@ -23,22 +51,47 @@ class AgentRegistry:
 
     _instance: Optional["AgentRegistry"] = None
     _initialized: bool = False
+    _instance_lock = threading.Lock()
 
     def __new__(cls) -> "AgentRegistry":
-        """싱글톤 패턴 구현"""
+        """싱글톤 패턴 구현 (double-checked locking)"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self):
         """Registry 초기화"""
-        if not self._initialized:
+        if self._initialized:
+            return
+
+        with self._instance_lock:
+            if self._initialized:
+                return
             self._agents: Dict[str, Type[BaseAgent]] = {}
             self._instances: Dict[str, BaseAgent] = {}
-            self._metadata: Dict[str, Dict[str, Any]] = {}
+            self._metadata: Dict[str, AgentMetadata] = {}
+            # 능력 -> Agent ID 역색인 (값은 생성 순서를 유지하는 dict 기반 집합)
+            self._by_capability: Dict[str, Dict[str, None]] = {}
+            # 텍스트 검색용 역색인: 토큰 -> {Agent ID: 등장 횟수}, Agent ID -> 문서 길이
+            self._by_token: Dict[str, Dict[str, int]] = {}
+            self._doc_lengths: Dict[str, int] = {}
+            # (우선순위, Agent ID) 정렬 색인 (값이 작을수록 우선)
+            self._priority_sorted: List[Tuple[int, str]] = []
             self._initialized = True
             logger.info("[AgentRegistry] Initialized")
 
+    @classmethod
+    def isolated(cls) -> "AgentRegistry":
+        """싱글톤과 상태를 공유하지 않는 독립 Registry 생성
+
+        테스트/테넌트별 격리에 사용합니다. 보통 agent_scope()로 활성화합니다.
+        """
+        registry = object.__new__(cls)
+        registry.__init__()
+        return registry
+
     def register(
         self,
         agent_class: Type[BaseAgent],
@@ -65,12 +118,12 @@ class AgentRegistry:
 
         # 중복 검사
         if agent_id in self._agents and not override:
-            logger.warning(f"[AgentRegistry] Agent {agent_id} already registered")
+            logger.warning("[AgentRegistry] Agent %s already registered", agent_id)
             return False
 
         # 등록
         self._agents[agent_id] = agent_class
-        logger.info(f"[AgentRegistry] Registered agent: {agent_id} -> {agent_class.__name__}")
+        logger.info("[AgentRegistry] Registered agent: %s -> %s", agent_id, agent_class.__name__)
 
         return True
 
@@ -100,7 +153,7 @@ class AgentRegistry:
         agents_path = Path(path)
 
         if not agents_path.exists():
-            logger.warning(f"[AgentRegistry] Path does not exist: {path}")
+            logger.warning("[AgentRegistry] Path does not exist: %s", path)
             return 0
 
         # 모든 Python 파일 검색
@@ -123,9 +176,9 @@ class AgentRegistry:
                             discovered += 1
 
             except Exception as e:
-                logger.debug(f"[AgentRegistry] Failed to import {py_file}: {e}")
+                logger.debug("[AgentRegistry] Failed to import %s: %s", py_file, e)
 
-        logger.info(f"[AgentRegistry] Discovered {discovered} agents from {path}")
+        logger.info("[AgentRegistry] Discovered %s agents from %s", discovered, path)
         return discovered
 
     def get_agent_class(self, agent_id: str) -> Optional[Type[BaseAgent]]:
@@ -155,32 +208,98 @@ class AgentRegistry:
         Returns:
             생성된 Agent 인스턴스 또는 None
         """
-        agent_class = self.get_agent_class(agent_id)
-        if not agent_class:
-            logger.error(f"[AgentRegistry] Agent not found: {agent_id}")
+        # 등록된 Agent가 일반적인 경우이므로 조회 한 번으로 처리 (EAFP)
+        try:
+            agent_class = self._agents[agent_id]
+        except KeyError:
+            logger.error("[AgentRegistry] Agent not found: %s", agent_id)
             return None
 
         try:
             # Agent 인스턴스 생성
-            if agent_name is None:
-                agent_name = agent_id.replace("_", " ").title()
-
-            agent = agent_class(
-                agent_id=agent_id,
-                agent_name=agent_name,
-                **kwargs
-            )
-
-            # 인스턴스 캐싱
-            self._instances[agent_id] = agent
-
-            logger.info(f"[AgentRegistry] Created agent instance: {agent_id}")
+            agent = self._construct_agent(agent_class, agent_id, agent_name, **kwargs)
+            self._cache_instance(agent_id, agent)
             return agent
 
         except Exception as e:
-            logger.error(f"[AgentRegistry] Failed to create agent {agent_id}: {e}")
+            logger.error("[AgentRegistry] Failed to create agent %s: %s", agent_id, e)
             return None
 
+    async def create_agents(
+        self,
+        agent_ids: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Optional[BaseAgent]]:
+        """여러 Agent 인스턴스를 병렬 생성
+
+        생성자(LLM 클라이언트/DB 연결 준비 등)는 스레드에서 동시에 실행하고,
+        인스턴스 캐싱과 색인 갱신은 호출한 쪽에서 순서대로 반영합니다.
+        한 Agent의 생성 실패가 나머지 생성을 중단시키지 않습니다.
+
+        Args:
+            agent_ids: 생성할 Agent ID 목록 (None이면 등록된 전체)
+            **kwargs: 각 Agent 초기화 인자
+
+        Returns:
+            Agent ID별 생성된 인스턴스 (실패 시 None)
+        """
+        if agent_ids is None:
+            agent_ids = list(self._agents)
+
+        created: Dict[str, Optional[BaseAgent]] = {}
+        pending: List[Tuple[str, Type[BaseAgent]]] = []
+        get_agent_class = self._agents.get
+        for agent_id in agent_ids:
+            agent_class = get_agent_class(agent_id)
+            if agent_class is None:
+                logger.error("[AgentRegistry] Agent not found: %s", agent_id)
+                created[agent_id] = None
+            else:
+                pending.append((agent_id, agent_class))
+
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._construct_agent, agent_class, agent_id, None, **kwargs)
+                for agent_id, agent_class in pending
+            ),
+            return_exceptions=True
+        )
+
+        for (agent_id, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error("[AgentRegistry] Failed to create agent %s: %s", agent_id, result)
+                created[agent_id] = None
+                continue
+            self._cache_instance(agent_id, result)
+            created[agent_id] = result
+
+        return created
+
+    @staticmethod
+    def _construct_agent(
+        agent_class: Type[BaseAgent],
+        agent_id: str,
+        agent_name: Optional[str] = None,
+        **kwargs
+    ) -> BaseAgent:
+        """Agent 클래스 인스턴스화 (Registry 상태는 변경하지 않음)"""
+        if agent_name is None:
+            agent_name = agent_id.replace("_", " ").title()
+
+        return agent_class(
+            agent_id=agent_id,
+            agent_name=agent_name,
+            **kwargs
+        )
+
+    def _cache_instance(self, agent_id: str, agent: BaseAgent):
+        """인스턴스 캐싱 및 능력 역색인 갱신"""
+        self._unindex_capabilities(agent_id)
+        self._instances[agent_id] = agent
+        self._index_capabilities(agent_id, agent)
+
+        logger.info("[AgentRegistry] Created agent instance: %s", agent_id)
+
     def get_agent_instance(self, agent_id: str) -> Optional[BaseAgent]:
         """캐시된 Agent 인스턴스 가져오기
 
@@ -192,6 +311,103 @@ class AgentRegistry:
         """
         return self._instances.get(agent_id)
 
+    def find_agents_by_capability(self, *capabilities: str) -> List[str]:
+        """주어진 능력을 모두 가진 Agent 조회 (역색인 교집합)
+
+        Args:
+            *capabilities: 필요한 능력들
+
+        Returns:
+            모든 능력을 가진 Agent ID 목록 (인스턴스 생성 순)
+        """
+        if not capabilities:
+            return []
+
+        postings = [self._by_capability.get(capability, {}) for capability in capabilities]
+        smallest = min(postings, key=len)
+        return [
+            agent_id for agent_id in smallest
+            if all(agent_id in posting for posting in postings)
+        ]
+
+    def search_agents(self, task_text: str, k: int = 10) -> List[Tuple[str, float]]:
+        """작업 설명과 관련된 Agent 검색 (BM25)
+
+        능력 문자열을 정확히 몰라도 이름/설명/능력 토큰이 겹치는 Agent를
+        점수순으로 반환합니다.
+
+        Args:
+            task_text: 작업 설명
+            k: 최대 반환 개수
+
+        Returns:
+            (Agent ID, 점수) 목록 (점수 내림차순)
+        """
+        total_docs = len(self._doc_lengths)
+        if not total_docs:
+            return []
+
+        avg_length = sum(self._doc_lengths.values()) / total_docs
+        scores: Dict[str, float] = {}
+
+        for token in set(_TOKEN_RE.findall(task_text.casefold())):
+            posting = self._by_token.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (total_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for agent_id, tf in posting.items():
+                norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self._doc_lengths[agent_id] / avg_length)
+                scores[agent_id] = scores.get(agent_id, 0.0) + idf * tf * (_BM25_K1 + 1) / (tf + norm)
+
+        # 전체 정렬 대신 상위 k개만 선택 (O(N log k))
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    def _index_capabilities(self, agent_id: str, agent: BaseAgent):
+        """Agent 인스턴스의 능력을 역색인에 추가"""
+        for capability in agent.capabilities:
+            self._by_capability.setdefault(capability, {})[agent_id] = None
+
+        # 텍스트 검색용 토큰 색인 (이름 + 설명 + 능력)
+        text = " ".join([agent_id, agent.agent_name, agent.description, *agent.capabilities])
+        tokens = Counter(_TOKEN_RE.findall(text.casefold()))
+        for token, tf in tokens.items():
+            self._by_token.setdefault(token, {})[agent_id] = tf
+        self._doc_lengths[agent_id] = sum(tokens.values())
+
+        priority = int(agent.priority)
+        bisect.insort(self._priority_sorted, (priority, agent_id))
+
+        self._metadata[agent_id] = AgentMetadata(
+            capabilities=tuple(agent.capabilities),
+            tokens=tuple(tokens),
+            priority=priority
+        )
+
+    def _unindex_capabilities(self, agent_id: str):
+        """기존 인스턴스의 능력을 역색인에서 제거"""
+        metadata = self._metadata.pop(agent_id, None)
+        if metadata is None:
+            return
+
+        for index, keys in (
+            (self._by_capability, metadata.capabilities),
+            (self._by_token, metadata.tokens),
+        ):
+            for key in keys:
+                posting = index.get(key)
+                if posting is None:
+                    continue
+                posting.pop(agent_id, None)
+                if not posting:
+                    del index[key]
+
+        self._doc_lengths.pop(agent_id, None)
+
+        entry = (metadata.priority, agent_id)
+        position = bisect.bisect_left(self._priority_sorted, entry)
+        if position < len(self._priority_sorted) and self._priority_sorted[position] == entry:
+            del self._priority_sorted[position]
+
     def list_agents(self, filter_by: Optional[Dict[str, Any]] = None) -> List[str]:
         """등록된 Agent 목록 조회
 
@@ -201,23 +417,20 @@ class AgentRegistry:
         Returns:
             Agent ID 목록
         """
-        agent_ids = list(self._agents.keys())
-
         if filter_by:
+            # 필터는 인스턴스 속성 기준이므로 인스턴스가 있는 Agent만 순회
             filtered = []
-            for agent_id in agent_ids:
-                agent_instance = self.get_agent_instance(agent_id)
-                if agent_instance:
-                    match = True
-                    for key, value in filter_by.items():
-                        if not hasattr(agent_instance, key) or getattr(agent_instance, key) != value:
-                            match = False
-                            break
-                    if match:
-                        filtered.append(agent_id)
+            for agent_id, agent_instance in self._instances.items():
+                match = True
+                for key, value in filter_by.items():
+                    if not hasattr(agent_instance, key) or getattr(agent_instance, key) != value:
+                        match = False
+                        break
+                if match:
+                    filtered.append(agent_id)
             return filtered
 
-        return agent_ids
+        return list(self._agents.keys())
 
     def get_agents_by_priority(self, priority: AgentPriority) -> List[str]:
         """우선순위별 Agent 목록 조회
@@ -228,12 +441,10 @@ class AgentRegistry:
         Returns:
             해당 우선순위의 Agent ID 목록
         """
-        agents = []
-        for agent_id in self._agents.keys():
-            instance = self.get_agent_instance(agent_id)
-            if instance and instance.priority == priority:
-                agents.append(agent_id)
-        return agents
+        # 정렬 색인에서 해당 우선순위 구간만 잘라냄 (Agent ID 순)
+        start = bisect.bisect_left(self._priority_sorted, (priority, ""))
+        end = bisect.bisect_left(self._priority_sorted, (priority + 1, ""))
+        return [agent_id for _, agent_id in self._priority_sorted[start:end]]
 
     def get_agents_with_checkpoint(self) -> List[str]:
         """Checkpoint를 사용하는 Agent 목록 조회
@@ -264,16 +475,15 @@ class AgentRegistry:
             문제가 있는 의존성 정보
         """
         issues = {}
-        all_agents = set(self._agents.keys())
+        all_agents = self._agents.keys()
 
-        for agent_id in all_agents:
-            agent = self.get_agent_instance(agent_id)
-            if agent:
-                for dep in agent.dependencies:
-                    if dep not in all_agents:
-                        if agent_id not in issues:
-                            issues[agent_id] = []
-                        issues[agent_id].append(f"Missing dependency: {dep}")
+        # 의존성은 인스턴스에만 있으므로 인스턴스가 있는 Agent만 검사
+        for agent_id, agent in self._instances.items():
+            for dep in agent.dependencies:
+                if dep not in all_agents:
+                    if agent_id not in issues:
+                        issues[agent_id] = []
+                    issues[agent_id].append(f"Missing dependency: {dep}")
 
         return issues
 
@@ -282,6 +492,10 @@ class AgentRegistry:
         self._agents.clear()
         self._instances.clear()
         self._metadata.clear()
+        self._by_capability.clear()
+        self._by_token.clear()
+        self._doc_lengths.clear()
+        self._priority_sorted.clear()
         logger.info("[AgentRegistry] Cleared all agents")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -292,13 +506,21 @@ class AgentRegistry:
         """
         total_agents = len(self._agents)
         instantiated = len(self._instances)
-        with_checkpoint = len(self.get_agents_with_checkpoint())
 
-        priority_counts = {}
-        for priority in AgentPriority:
-            count = len(self.get_agents_by_priority(priority))
-            if count > 0:
-                priority_counts[priority.name] = count
+        # 등록된 Agent의 인스턴스를 한 번만 순회하며 집계
+        # (우선순위별/Checkpoint 조회를 각각 호출하면 Registry를 여러 번 순회)
+        with_checkpoint = 0
+        by_priority = Counter()
+        for instance in self._instances.values():
+            if getattr(instance, "enable_checkpoint", False):
+                with_checkpoint += 1
+            by_priority[instance.priority] += 1
+
+        priority_counts = {
+            priority.name: by_priority[priority]
+            for priority in AgentPriority
+            if by_priority[priority] > 0
+        }
 
         return {
             "total_registered": total_agents,
@@ -335,16 +557,52 @@ class AgentRegistry:
         )
 
 
-# 전역 Registry 인스턴스
+# 전역 Registry 인스턴스 (기본 scope)
 agent_registry = AgentRegistry()
 
+# 현재 실행 컨텍스트의 Registry (None이면 전역 Registry)
+_current_registry: ContextVar[Optional[AgentRegistry]] = ContextVar(
+    "agent_registry_scope", default=None
+)
+
+
+def get_agent_registry() -> AgentRegistry:
+    """현재 scope의 Registry 가져오기
+
+    agent_scope() 안에서는 해당 scope의 Registry를, 그 외에는 전역 Registry를 반환합니다.
+    """
+    return _current_registry.get() or agent_registry
+
+
+@contextmanager
+def agent_scope(registry: Optional[AgentRegistry] = None) -> Iterator[AgentRegistry]:
+    """독립 Registry scope 활성화
+
+    ContextVar 기반이므로 asyncio Task/스레드별로 격리되며,
+    scope 종료 시 이전 Registry로 복원됩니다.
+
+    Usage:
+        with agent_scope() as registry:
+            registry.register(DietAgent)
+            ...
+
+    Args:
+        registry: 사용할 Registry (None이면 AgentRegistry.isolated())
+    """
+    scoped = registry if registry is not None else AgentRegistry.isolated()
+    token = _current_registry.set(scoped)
+    try:
+        yield scoped
+    finally:
+        _current_registry.reset(token)
+
 
 def register_agent(agent_id: Optional[str] = None):
-    """Agent 등록 데코레이터 (편의 함수)
+    """Agent 등록 데코레이터 (편의 함수, 현재 scope의 Registry에 등록)
 
     Usage:
         @register_agent("diet_agent")
         class DietAgent(BaseAgent):
             ...
     """
-    return agent_registry.register_decorator(agent_id)
\ No newline at end of file
+    return get_agent_registry().register_decorator(agent_id)
\ No newline at end of file
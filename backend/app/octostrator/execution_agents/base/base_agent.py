@@ -8,7 +8,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List, TypedDict
 from datetime import datetime
 import logging
-from enum import Enum
+from enum import Enum, IntEnum
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph import StateGraph, END, START
@@ -28,8 +28,8 @@ class AgentStatus(Enum):
     WAITING_DEPENDENCY = "waiting_dependency"
 
 
-class AgentPriority(Enum):
-    """Agent 실행 우선순위"""
+class AgentPriority(IntEnum):
+    """Agent 실행 우선순위 (값이 작을수록 우선, 정수 비교/정렬 가능)"""
     CRITICAL = 1
     HIGH = 2
     NORMAL = 3
@@ -76,6 +76,10 @@ class BaseAgent(ABC):
         self.dependencies = dependencies or []
         self.metadata = metadata or {}
 
+        # Agent 능력 (하위 클래스에서 설정, CapabilityBasedRouter가 사용)
+        self.capabilities: List[str] = []
+        self.primary_capabilities: List[str] = []
+
         # Runtime properties
         self.status = AgentStatus.IDLE
         self.graph: Optional[CompiledStateGraph] = None
@@ -248,7 +252,7 @@ class BaseAgent(ABC):
         """
         for dep in self.dependencies:
             if dep not in completed_agents:
-                logger.debug(f"[BaseAgent] {self.agent_name} waiting for dependency: {dep}")
+                logger.debug("[BaseAgent] %s waiting for dependency: %s", self.agent_name, dep)
                 return False
         return True
 
@@ -91,19 +91,13 @@ class CapabilityBasedRouter:
         if capability in self._capability_cache:
             return self._capability_cache[capability]
 
-        matching_agents = []
-
-        for agent_id in self.registry.list_agents():
-            agent = self.registry.get_agent_instance(agent_id)
-
-            if agent and hasattr(agent, 'capabilities'):
-                if capability in agent.capabilities:
-                    matching_agents.append(agent_id)
+        # Registry의 능력 역색인 조회 (전체 Agent 순회 없음)
+        matching_agents = self.registry.find_agents_by_capability(capability)
 
         # 캐시 저장
         self._capability_cache[capability] = matching_agents
 
-        logger.info(f"[CapabilityRouter] Found {len(matching_agents)} agents for {capability}")
+        logger.info("[CapabilityRouter] Found %s agents for %s", len(matching_agents), capability)
         return matching_agents
 
     def find_best_agent(
@@ -123,30 +117,24 @@ class CapabilityBasedRouter:
         candidates = self.find_agents_for_capability(required_capability)
 
         if not candidates:
-            logger.warning(f"[CapabilityRouter] No agent found for {required_capability}")
+            logger.warning("[CapabilityRouter] No agent found for %s", required_capability)
             return None
 
         if len(candidates) == 1:
             return candidates[0]
 
-        # 여러 후보가 있을 때 점수 기반 선택
-        scored_candidates = []
-
-        for agent_id in candidates:
-            score = self._calculate_fitness_score(
+        # 여러 후보가 있을 때 점수 기반 선택 (최고점 하나만 필요하므로 정렬 없이 max)
+        best_agent = max(
+            candidates,
+            key=lambda agent_id: self._calculate_fitness_score(
                 agent_id,
                 required_capability,
                 context
             )
-            scored_candidates.append((agent_id, score))
-
-        # 점수순 정렬
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
-
-        best_agent = scored_candidates[0][0]
+        )
         logger.info(
-            f"[CapabilityRouter] Selected {best_agent} for {required_capability} "
-            f"from {len(candidates)} candidates"
+            "[CapabilityRouter] Selected %s for %s from %s candidates",
+            best_agent, required_capability, len(candidates)
         )
 
         return best_agent
@@ -173,20 +161,16 @@ class CapabilityBasedRouter:
         if not agent:
             return 0.0
 
-        # 주 능력인지 확인
-        if hasattr(agent, 'primary_capabilities'):
-            if capability in agent.primary_capabilities:
-                score += 1.0  # 주 능력이면 보너스
-            else:
-                score += 0.5  # 보조 능력
+        # 주 능력인지 확인 (BaseAgent가 capabilities/priority 속성을 항상 제공)
+        if capability in agent.primary_capabilities:
+            score += 1.0  # 주 능력이면 보너스
         else:
-            score += 0.5  # 기본 점수
+            score += 0.5  # 보조 능력 또는 기본 점수
 
         # 우선순위 고려
-        if hasattr(agent, 'priority'):
-            # 높은 우선순위일수록 높은 점수
-            # (CRITICAL=1, HIGH=2, NORMAL=3, LOW=4)
-            score += (5 - agent.priority.value) * 0.2
+        # 높은 우선순위일수록 높은 점수
+        # (CRITICAL=1, HIGH=2, NORMAL=3, LOW=4)
+        score += (5 - agent.priority) * 0.2
 
         # 컨텍스트 기반 추가 점수
         if context:
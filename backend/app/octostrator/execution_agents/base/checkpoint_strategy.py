@@ -23,6 +23,14 @@ class CheckpointMode(Enum):
     ON_COMPLETE = "on_complete"  # 완료 시에만 저장
 
 
+# 전략이 등록되지 않은 Agent의 이름 키워드 -> 모드 추론 규칙 (순서대로 검사, 읽기 전용)
+_INFERRED_STRATEGIES = (
+    (("diet", "workout", "coaching", "payment"), CheckpointMode.AUTO),
+    (("notification", "reporting", "summary"), CheckpointMode.NONE),
+    (("schedule", "reminder"), CheckpointMode.PERIODIC),
+)
+
+
 class CheckpointStrategy:
     """Checkpoint 전략 관리 클래스
 
@@ -80,19 +88,18 @@ class CheckpointStrategy:
             Checkpoint 모드
         """
         # 등록된 전략이 없으면 Agent 이름으로 추론
-        if agent_id not in self.strategies:
-            # 기본적으로 복잡한 Agent는 AUTO, 단순한 Agent는 NONE
-            if any(keyword in agent_id for keyword in ["diet", "workout", "coaching", "payment"]):
-                return CheckpointMode.AUTO
-            elif any(keyword in agent_id for keyword in ["notification", "reporting", "summary"]):
-                return CheckpointMode.NONE
-            elif any(keyword in agent_id for keyword in ["schedule", "reminder"]):
-                return CheckpointMode.PERIODIC
-            else:
-                # 기본값: 중간 복잡도는 ON_COMPLETE
-                return CheckpointMode.ON_COMPLETE
-
-        return self.strategies[agent_id]
+        # 기본적으로 복잡한 Agent는 AUTO, 단순한 Agent는 NONE
+        try:
+            return self.strategies[agent_id]
+        except KeyError:
+            pass
+
+        for keywords, mode in _INFERRED_STRATEGIES:
+            if any(keyword in agent_id for keyword in keywords):
+                return mode
+
+        # 기본값: 중간 복잡도는 ON_COMPLETE
+        return CheckpointMode.ON_COMPLETE
 
     def should_use_checkpoint(self, agent_id: str) -> bool:
         """Agent가 Checkpoint를 사용해야 하는지 확인
@@ -6,7 +6,8 @@ Topological Sort를 사용하여 순환 의존성을 감지하고 최적 실행
 
 import logging
 from typing import Dict, List, Set, Optional, Tuple, Any
-from collections import defaultdict, deque
+from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -20,20 +21,22 @@ class DependencyStatus(Enum):
     READY = "ready"  # 실행 가능
 
 
+@dataclass(slots=True)
 class ExecutionPlan:
-    """Agent 실행 계획"""
+    """Agent 실행 계획
 
-    def __init__(self, agent_order: List[str], parallel_groups: List[List[str]]):
-        """ExecutionPlan 초기화
+    실행 중 mark_completed()/mark_failed()로 자주 갱신되므로
+    slots 기반 dataclass로 정의합니다 (인스턴스 __dict__ 없음).
 
-        Args:
-            agent_order: 순차 실행 순서
-            parallel_groups: 병렬 실행 가능 그룹
-        """
-        self.agent_order = agent_order
-        self.parallel_groups = parallel_groups
-        self.executed_agents: Set[str] = set()
-        self.failed_agents: Set[str] = set()
+    Args:
+        agent_order: 순차 실행 순서
+        parallel_groups: 병렬 실행 가능 그룹
+    """
+
+    agent_order: List[str]
+    parallel_groups: List[List[str]]
+    executed_agents: Set[str] = field(default_factory=set, init=False)
+    failed_agents: Set[str] = field(default_factory=set, init=False)
 
     def get_next_agents(self) -> List[str]:
         """다음 실행할 Agent 목록
@@ -115,6 +118,10 @@ class DependencyResolver:
             agent_id: Agent ID
             dependencies: 의존하는 Agent ID 목록
         """
+        # 재등록 시 이전 의존성의 역방향 링크 제거 (level 계산의 in-degree 일관성 유지)
+        for old_dep in self.dependencies.get(agent_id, []):
+            self.dependents[old_dep].discard(agent_id)
+
         self.dependencies[agent_id] = dependencies or []
 
         # 역방향 의존성 업데이트
@@ -124,7 +131,7 @@ class DependencyResolver:
         # 캐시 무효화
         self._validation_cache = None
 
-        logger.debug(f"[DependencyResolver] Added {agent_id} with dependencies: {dependencies}")
+        logger.debug("[DependencyResolver] Added %s with dependencies: %s", agent_id, dependencies)
 
     def remove_agent(self, agent_id: str):
         """Agent 제거
@@ -143,17 +150,16 @@ class DependencyResolver:
             self.dependents[dep].discard(agent_id)
 
         # 이 Agent를 의존하는 다른 Agent들의 의존성에서 제거
-        for other_agent, other_deps in self.dependencies.items():
-            if agent_id in other_deps:
+        # (역방향 의존성 집합으로 해당 Agent만 방문, 전체 Agent 순회 없음)
+        for other_agent in self.dependents.pop(agent_id, ()):
+            other_deps = self.dependencies.get(other_agent)
+            if other_deps and agent_id in other_deps:
                 other_deps.remove(agent_id)
 
-        # 역방향 의존성 딕셔너리에서 제거
-        self.dependents.pop(agent_id, None)
-
         # 캐시 무효화
         self._validation_cache = None
 
-        logger.debug(f"[DependencyResolver] Removed {agent_id}")
+        logger.debug("[DependencyResolver] Removed %s", agent_id)
 
     def validate(self) -> Tuple[DependencyStatus, Optional[Dict[str, Any]]]:
         """모든 의존성 검증
@@ -226,39 +232,12 @@ class DependencyResolver:
         Returns:
             Agent 실행 순서 또는 None (순환 의존성이 있는 경우)
         """
-        # 의존성 검증
-        status, _ = self.validate()
-        if status != DependencyStatus.VALID:
+        groups = self.get_parallel_groups()
+        if groups is None:
             return None
 
-        # Kahn's Algorithm 사용
-        in_degree = {agent: 0 for agent in self.dependencies}
-
-        # In-degree 계산
-        for agent, deps in self.dependencies.items():
-            for dep in deps:
-                if dep in in_degree:
-                    in_degree[dep] += 1
-
-        # In-degree가 0인 노드로 시작
-        queue = deque([agent for agent, degree in in_degree.items() if degree == 0])
-        result = []
-
-        while queue:
-            current = queue.popleft()
-            result.append(current)
-
-            # 현재 노드를 의존하는 노드들의 in-degree 감소
-            for dependent in self.dependents[current]:
-                in_degree[dependent] -= 1
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
-
-        # 모든 노드를 방문했는지 확인
-        if len(result) != len(self.dependencies):
-            return None  # 순환 의존성 존재
-
-        return result
+        # Level 순서대로 펼치면 의존성이 항상 먼저 오는 실행 순서가 됨
+        return [agent for group in groups for agent in group]
 
     def get_parallel_groups(self) -> Optional[List[List[str]]]:
         """병렬 실행 가능한 Agent 그룹 계산
@@ -271,45 +250,35 @@ class DependencyResolver:
         if status != DependencyStatus.VALID:
             return None
 
-        # Level-based grouping
-        levels = {}
-        in_degree = {agent: len(self.dependencies[agent]) for agent in self.dependencies}
+        # Kahn's Algorithm을 Level 단위로 실행 (O(V + E))
+        # In-degree = 아직 완료되지 않은 의존성 수
+        # (dependents가 집합이므로 중복 의존성은 한 번만 셈)
+        in_degree = {agent: len(set(deps)) for agent, deps in self.dependencies.items()}
 
         # Level 0: 의존성이 없는 Agent들
-        current_level = 0
-        queue = deque([agent for agent, degree in in_degree.items() if degree == 0])
+        frontier = [agent for agent, degree in in_degree.items() if degree == 0]
+        groups = []
+        processed = 0
 
-        for agent in queue:
-            levels[agent] = current_level
+        while frontier:
+            groups.append(sorted(frontier))
+            processed += len(frontier)
 
-        processed = set(queue)
+            next_frontier = []
+            for current in frontier:
+                # 현재 Agent를 의존하는 Agent들의 in-degree 감소
+                for dependent in self.dependents[current]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_frontier.append(dependent)
 
-        while queue:
-            next_queue = deque()
+            frontier = next_frontier
 
-            for current in queue:
-                # 이 Agent를 의존하는 Agent들 확인
-                for dependent in self.dependents[current]:
-                    if dependent not in processed:
-                        # 모든 의존성이 처리되었는지 확인
-                        deps_satisfied = all(dep in processed for dep in self.dependencies[dependent])
-
-                        if deps_satisfied:
-                            next_queue.append(dependent)
-                            processed.add(dependent)
-                            # Level은 의존성 중 최대 level + 1
-                            dep_levels = [levels[dep] for dep in self.dependencies[dependent]]
-                            levels[dependent] = max(dep_levels) + 1 if dep_levels else 0
-
-            queue = next_queue
-
-        # Level별로 그룹핑
-        groups = defaultdict(list)
-        for agent, level in levels.items():
-            groups[level].append(agent)
-
-        # Level 순서대로 반환
-        return [groups[level] for level in sorted(groups.keys())]
+        # 모든 Agent를 처리하지 못했다면 순환 의존성 존재
+        if processed != len(self.dependencies):
+            return None
+
+        return groups
 
     def create_execution_plan(self, selected_agents: Optional[List[str]] = None) -> Optional[ExecutionPlan]:
         """실행 계획 생성
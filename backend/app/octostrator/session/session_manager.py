@@ -2,10 +2,11 @@
 
 Phase 4.1: thread_id 기반 세션 생성 및 관리
 """
-import uuid
 from typing import Dict, Optional
 from datetime import datetime
 
+from backend.app.utils.id_pool import pool_hex
+
 
 class SessionManager:
     """세션 관리 클래스
@@ -31,7 +32,7 @@ class SessionManager:
         Returns:
             str: 생성된 thread_id
         """
-        thread_id = f"thread_{uuid.uuid4().hex[:16]}"
+        thread_id = f"thread_{pool_hex(8)}"
 
         session_data = {
             "thread_id": thread_id,
@@ -33,10 +33,16 @@ Version: 2.0 (Domain-Agnostic)
 
 import logging
 import json
+import re
 from typing import Dict, Any, List, Optional
 
+from langchain_core.messages import HumanMessage
+
 logger = logging.getLogger(__name__)
 
+# LLM 응답의 Markdown code block (```json ... ```) 본문 추출
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.DOTALL)
+
 
 class IntentClassifier:
     """
@@ -178,15 +184,15 @@ Return JSON:
 
     ### Step 1: Agent Capabilities에서 Intent 자동 추출
     ```python
-    from backend.app.octostrator.execution_agents import agent_registry
+    from backend.app.octostrator.execution_agents import get_agent_registry
     from backend.app.octostrator.execution_agents.base.capabilities import Capability
 
     def __init__(self, registry=None):
         \"\"\"
         Args:
-            registry: AgentRegistry 인스턴스 (None이면 전역 사용)
+            registry: AgentRegistry 인스턴스 (None이면 현재 스코프의 Registry 사용)
         \"\"\"
-        self.registry = registry or agent_registry
+        self.registry = registry or get_agent_registry()
         self._build_dynamic_intents()
 
     def _build_dynamic_intents(self):
@@ -357,12 +363,12 @@ Return JSON:
 
     ### 향후 사용법 (Option B: Registry 기반)
     ```python
-    from backend.app.octostrator.execution_agents import agent_registry
+    from backend.app.octostrator.execution_agents import get_agent_registry
 
     # Agent Registry에 의료 Agent 추가 시
     # (별도 설정 없이 자동으로 medical_analysis intent 지원)
 
-    classifier = IntentClassifier(registry=agent_registry)
+    classifier = IntentClassifier(registry=get_agent_registry())
     result = classifier.classify("환자 진료 기록 분석해줘")
     # Output: {
     #   "intent": "medical_data_analysis",  # Agent의 capability에서 자동 추출
@@ -437,8 +443,6 @@ Return JSON:
             }
 
         try:
-            from langchain_core.messages import HumanMessage
-
             # LLM 프롬프트 생성
             prompt = f"""Analyze the user's intent from their message.
 
@@ -464,9 +468,7 @@ Return JSON only (no markdown, no extra text):
 
             # Markdown code block 제거 (```json ... ``` 형식)
             if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:].strip()
+                content = _CODE_FENCE_RE.match(content).group(1)
 
             result = json.loads(content)
 
@@ -243,10 +243,10 @@ async def intent_understanding_node(state: Dict[str, Any]) -> Dict[str, Any]:
     Agent Registry의 capabilities를 활용하여 분류:
 
     ```python
-    from backend.app.octostrator.execution_agents import agent_registry
+    from backend.app.octostrator.execution_agents import get_agent_registry
 
     # Registry 기반 분류기 사용
-    classifier = IntentClassifier(registry=agent_registry)
+    classifier = IntentClassifier(registry=get_agent_registry())
     intent_result = await classifier.classify_with_registry(user_query)
     ```
 
@@ -531,7 +531,7 @@ async def planning_node(state: Dict[str, Any]) -> Dict[str, Any]:
         user_query = state.get("user_query", "")
 
         # Agent Registry에서 사용 가능한 Agent 조회
-        # available_agents = agent_registry.list_agents()
+        # available_agents = get_agent_registry().list_agents()
         # agents_info = [...]
 
         prompt = f\"\"\"Create an execution plan.
@@ -555,7 +555,7 @@ Return JSON with goal, intent, and steps.\"\"\"
     from backend.app.octostrator.execution_agents.base.capabilities import CapabilityBasedRouter
 
     async def planning_node(state: Dict[str, Any]) -> Dict[str, Any]:
-        router = CapabilityBasedRouter(agent_registry)
+        router = CapabilityBasedRouter(get_agent_registry())
 
         # Intent를 Capability로 변환
         required_capability = intent_to_capability(state.get("user_intent"))
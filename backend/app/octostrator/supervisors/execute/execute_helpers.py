@@ -10,7 +10,8 @@ Version: 1.0
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Set
+from contextlib import aclosing
+from typing import Dict, Any, List, Set, AsyncIterator, Tuple
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
@@ -97,31 +98,6 @@ class AgentExecutor:
                 "agent": agent_id
             }
 
-    async def execute_parallel(self, tasks: List[Dict[str, Any]], context: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """
-        여러 Agent를 병렬로 실행합니다.
-        """
-        coroutines = [
-            self.execute(task.get("agent"), task, context)
-            for task in tasks
-        ]
-
-        results = await asyncio.gather(*coroutines, return_exceptions=True)
-
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "status": "failed",
-                    "error": str(result),
-                    "agent": tasks[i].get("agent")
-                })
-            else:
-                processed_results.append(result)
-
-        return processed_results
-
 
 class ExecuteSupervisor:
     """
@@ -135,23 +111,61 @@ class ExecuteSupervisor:
         self.resolver = DependencyResolver()
         self.executor = AgentExecutor()
 
-    async def execute(self, todos: List[Dict[str, Any]], context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def iter_results(
+        self,
+        todos: List[Dict[str, Any]],
+        context: Dict[str, Any] = None
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
         """
-        TODO 리스트를 받아 실행합니다.
+        TODO를 레벨 단위로 병렬 실행하며 완료되는 순서대로 (todo, result)를 반환합니다.
+
+        다음 레벨은 현재 레벨이 모두 끝난 뒤 시작하므로 의존성 순서는 유지되고,
+        호출자는 전체 실행을 기다리지 않고 부분 결과를 스트리밍할 수 있습니다.
+
+        중간에 순회를 멈출 수 있는 호출자는 contextlib.aclosing()으로 감싸야
+        남은 실행이 취소됩니다. (execute() 참고)
         """
         # 1. Resolve dependencies
         execution_levels = self.resolver.resolve(todos)
+        todo_map = {todo.get("id") or todo.get("step_id"): todo for todo in todos}
+
+        async def run(todo: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            try:
+                result = await self.executor.execute(todo.get("agent"), todo, context or {})
+            except Exception as e:
+                result = {
+                    "status": "failed",
+                    "error": str(e),
+                    "agent": todo.get("agent")
+                }
+            return todo, result
 
-        # 2. Execute level by level
-        all_results = []
+        # 2. Execute level by level (parallel within level)
         for level in execution_levels:
-            level_tasks = [t for t in todos if t.get("id") in level or t.get("step_id") in level]
+            pending = [asyncio.ensure_future(run(todo_map[task_id])) for task_id in level]
+            try:
+                for next_done in asyncio.as_completed(pending):
+                    yield await next_done
+            finally:
+                # 호출자가 중간에 순회를 멈추면 남은 실행 취소
+                for future in pending:
+                    future.cancel()
+
+    async def execute(self, todos: List[Dict[str, Any]], context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        TODO 리스트를 받아 실행합니다.
+        """
+        order = {id(todo): index for index, todo in enumerate(todos)}
+        finished = []
+        async with aclosing(self.iter_results(todos, context)) as stream:
+            async for todo, result in stream:
+                finished.append((order[id(todo)], result))
 
-            # Execute parallel within level
-            level_results = await self.executor.execute_parallel(level_tasks, context or {})
-            all_results.extend(level_results)
+        # 완료 순서가 아닌 TODO 순서로 반환
+        finished.sort(key=lambda item: item[0])
+        all_results = [result for _, result in finished]
 
-        # 3. Aggregate results
+        # Aggregate results
         return {
             "execution_results": all_results,
             "total_executed": len(all_results),
@@ -12,6 +12,7 @@ Version: 2.0 (Option A+ - 확장 가능)
 import logging
 from typing import Dict, Any, List, Optional
 from langchain_openai import ChatOpenAI
+from backend.app.utils.llm_cache import get_chat_model
 
 # Phase 2: Runtime import (optional for Phase 1)
 try:
@@ -55,7 +56,7 @@ def _create_llm_for_agents(runtime: Optional[Runtime] = None) -> ChatOpenAI:
                 f"max_tokens={settings.agent_max_tokens})"
             )
 
-            return ChatOpenAI(
+            return get_chat_model(
                 model=settings.agent_model,
                 temperature=settings.agent_temperature,
                 max_tokens=settings.agent_max_tokens,
@@ -73,7 +74,7 @@ def _create_llm_for_agents(runtime: Optional[Runtime] = None) -> ChatOpenAI:
         f"(model={default_model})"
     )
 
-    return ChatOpenAI(
+    return get_chat_model(
         model=default_model,
         api_key=system_config.openai_api_key,
         temperature=0.7,
@@ -108,7 +109,9 @@ async def execute_layer_node(
     Returns:
         Updated state with execution results
     """
-    from backend.app.octostrator.execution_agents import agent_registry
+    from backend.app.octostrator.execution_agents import get_agent_registry
+
+    agent_registry = get_agent_registry()
 
     try:
         # 1. State에서 필요한 데이터 가져오기
@@ -141,8 +144,9 @@ async def execute_layer_node(
         # 4. Todo별 Agent 실행
         for todo in todos:
             # Skip non-pending todos
-            if todo.get("status") != "pending":
-                logger.debug(f"[Execute] Skipping todo {todo.get('id')} (status: {todo.get('status')})")
+            todo_status = todo.get("status")
+            if todo_status != "pending":
+                logger.debug("[Execute] Skipping todo %s (status: %s)", todo.get("id"), todo_status)
                 continue
 
             agent_name = todo.get("agent")  # 예: "frontdesk_agent"
@@ -150,7 +154,7 @@ async def execute_layer_node(
             todo_id = todo.get("id")
 
             if not agent_name:
-                logger.warning(f"[Execute] Todo {todo_id} has no agent assigned, skipping")
+                logger.warning("[Execute] Todo %s has no agent assigned, skipping", todo_id)
                 continue
 
             try:
@@ -159,7 +163,7 @@ async def execute_layer_node(
                 if not agent_class:
                     raise ValueError(f"Agent '{agent_name}' not found in registry")
 
-                logger.info(f"[Execute] Running {agent_name} for todo {todo_id}")
+                logger.info("[Execute] Running %s for todo %s", agent_name, todo_id)
 
                 # 4.2 Agent 인스턴스 생성
                 agent = agent_class()
@@ -188,32 +192,36 @@ async def execute_layer_node(
                     thread_id=session_id  # Checkpoint용 (format: {session_id}_{agent_id})
                 )
 
-                # 4.6 결과 저장
+                # 4.6 결과 저장 (결과 필드는 한 번씩만 조회)
+                result_status = result.get("status", "unknown")
+                completed_at = result.get("completed_at")
+                error = result.get("error")
+
                 execution_results[todo_id] = {
                     "todo_id": todo_id,
                     "agent": agent_name,
-                    "status": result.get("status", "unknown"),
+                    "status": result_status,
                     "result": result.get("result", {}),
                     "started_at": result.get("started_at"),
-                    "completed_at": result.get("completed_at"),
-                    "error": result.get("error")
+                    "completed_at": completed_at,
+                    "error": error
                 }
 
                 # 4.7 Todo 상태 업데이트
-                if result.get("status") == "completed":
+                if result_status == "completed":
                     todo["status"] = "completed"
-                    todo["completed_at"] = result.get("completed_at")
+                    todo["completed_at"] = completed_at
                     completed += 1
-                    logger.info(f"[Execute] {agent_name} completed successfully for todo {todo_id}")
+                    logger.info("[Execute] %s completed successfully for todo %s", agent_name, todo_id)
                 else:
                     todo["status"] = "failed"
-                    todo["error"] = result.get("error")
+                    todo["error"] = error
                     failed += 1
-                    logger.error(f"[Execute] {agent_name} failed for todo {todo_id}: {result.get('error')}")
+                    logger.error("[Execute] %s failed for todo %s: %s", agent_name, todo_id, error)
 
             except Exception as e:
                 # 에러 처리: graceful degradation
-                logger.error(f"[Execute] Exception while executing {agent_name}: {e}", exc_info=True)
+                logger.error("[Execute] Exception while executing %s: %s", agent_name, e, exc_info=True)
 
                 execution_results[todo_id] = {
                     "todo_id": todo_id,
@@ -8,7 +8,9 @@ Date: 2025-11-05
 Version: 1.0
 """
 
+import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -19,6 +21,16 @@ from .octostrator_graph import build_octostrator_graph
 
 logger = logging.getLogger(__name__)
 
+# process_request 초기 state의 불변 기본값 (요청마다 kwargs dict를 새로 만들지 않음)
+_INITIAL_STATE_DEFAULTS: Dict[str, Any] = {
+    "final_response": "",
+
+    # Flags
+    "plan_valid": False,
+    "requires_approval": False,
+    "error": None
+}
+
 
 class OctostratorSupervisor:
     """
@@ -89,6 +101,7 @@ class OctostratorSupervisor:
         """
         try:
             start_time = datetime.now()
+            started = time.perf_counter()  # 실행 시간 측정용 (monotonic)
             logger.info(f"[Octostrator] Processing request for session: {session_id}")
 
             # Prepare context
@@ -100,8 +113,10 @@ class OctostratorSupervisor:
                 **(context or {})
             }
 
-            # Prepare initial state
+            # Prepare initial state (불변 기본값은 모듈 상수에서 복사)
             initial_state = {
+                **_INITIAL_STATE_DEFAULTS,
+
                 # User input
                 "user_query": user_message,
                 "session_id": session_id,
@@ -112,16 +127,10 @@ class OctostratorSupervisor:
                 "checkpointer": self.checkpointer,
                 "context": full_context,
 
-                # State tracking
+                # State tracking (mutable 컨테이너는 요청마다 새로 생성)
                 "plan": {},
                 "todos": [],
-                "execution_results": {},
-                "final_response": "",
-
-                # Flags
-                "plan_valid": False,
-                "requires_approval": False,
-                "error": None
+                "execution_results": {}
             }
 
             # Execute main graph
@@ -132,8 +141,9 @@ class OctostratorSupervisor:
                 config={"configurable": {"thread_id": session_id}}
             )
 
-            # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
+            # Calculate execution time (완료 시각은 한 번만 조회)
+            execution_time = time.perf_counter() - started
+            finished_at = datetime.now()
 
             # Build final result
             final_result = {
@@ -157,25 +167,24 @@ class OctostratorSupervisor:
 
                 # Metadata
                 "execution_time": f"{execution_time:.2f} seconds",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": finished_at.isoformat(),
 
                 # Error (if any)
                 "error": final_state.get("error")
             }
 
-            # Save to memory (optional)
-            if self.memory_manager:
-                await self._save_to_memory(
+            # Save to memory & notify completion (optional, 서로 독립적이므로 동시 실행)
+            await asyncio.gather(
+                self._save_to_memory(
                     session_id=session_id,
                     user_message=user_message,
                     result=final_result
+                ),
+                self._notify_progress(
+                    session_id,
+                    "execution_complete",
+                    final_result
                 )
-
-            # Notify completion (optional)
-            await self._notify_progress(
-                session_id,
-                "execution_complete",
-                final_result
             )
 
             logger.info(
@@ -250,7 +259,7 @@ class OctostratorSupervisor:
                     }
                 )
         except Exception as e:
-            logger.debug(f"[Octostrator] Failed to send notification: {e}")
+            logger.debug("[Octostrator] Failed to send notification: %s", e)
 
     def set_websocket_handler(self, handler):
         """
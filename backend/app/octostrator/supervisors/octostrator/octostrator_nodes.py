@@ -10,10 +10,12 @@ Version: 2.0
 """
 
 import logging
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime
 from backend.app.octostrator.states import OctostratorState
 from langchain_openai import ChatOpenAI
+from backend.app.utils.llm_cache import get_chat_model
 
 # Phase 3: Runtime import for Context API
 try:
@@ -52,7 +54,7 @@ def _create_llm_from_context(runtime: Optional[Runtime] = None) -> Optional[Chat
                 f"max_tokens={settings.agent_max_tokens})"
             )
 
-            return ChatOpenAI(
+            return get_chat_model(
                 model=settings.agent_model,
                 temperature=settings.agent_temperature,
                 max_tokens=settings.agent_max_tokens,
@@ -86,6 +88,7 @@ async def cognitive_layer_node(
         Updated state with plan and history
     """
     start_time = datetime.now()
+    started = time.perf_counter()  # 소요 시간 측정용 (monotonic)
     logger.info("[Octostrator] Executing Cognitive Layer")
 
     try:
@@ -125,7 +128,7 @@ async def cognitive_layer_node(
 
         # ===== History 기록 (신규) =====
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
         # Action history 기록
         state["action_history"] = [{
@@ -155,7 +158,7 @@ async def cognitive_layer_node(
     except Exception as e:
         logger.error(f"[Octostrator] Cognitive Layer failed: {e}")
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
         state["error"] = str(e)
         state["plan_valid"] = False
@@ -192,7 +195,7 @@ async def todo_layer_node(
     Returns:
         Updated state with todos and history
     """
-    start_time = datetime.now()
+    started = time.perf_counter()  # 소요 시간 측정용 (monotonic)
     logger.info("[Octostrator] Executing Todo Layer")
 
     try:
@@ -256,7 +259,7 @@ async def todo_layer_node(
 
         # ===== History 기록 (신규) =====
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
         state["action_history"] = [{
             "action": "todo_layer_node",
@@ -274,7 +277,7 @@ async def todo_layer_node(
     except Exception as e:
         logger.error(f"[Octostrator] Todo Layer failed: {e}")
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
         state["error"] = str(e)
         state["todos"] = []
@@ -313,7 +316,7 @@ async def execute_layer_node(
     Returns:
         Updated state with execution results and history
     """
-    start_time = datetime.now()
+    started = time.perf_counter()  # 소요 시간 측정용 (monotonic)
     logger.info("[Octostrator] Delegating to Execute Layer (Phase 1)")
 
     try:
@@ -324,46 +327,53 @@ async def execute_layer_node(
         todos = state.get("todos", [])
         if not todos:
             logger.warning("[Octostrator] No todos found in state")
-            state["execution_results"] = {}
-            state["completed"] = 0
-            state["failed"] = 0
-            state["success_rate"] = 0.0
+            state.update({
+                "execution_results": {},
+                "completed": 0,
+                "failed": 0,
+                "success_rate": 0.0
+            })
             return state
 
         # Execute Layer 호출 (Phase 3: runtime 전달)
         result = await execute_impl(state, runtime=runtime)  # Dict[str, Any] → Dict[str, Any]
 
         # ===== Result를 OctostratorState에 매핑 =====
-        state["execution_results"] = result.get("execution_results", {})
-        state["completed"] = result.get("completed", 0)
-        state["failed"] = result.get("failed", 0)
-        state["success_rate"] = result.get("success_rate", 0.0)
-
-        # Todos 업데이트 (execute_impl이 반환한 업데이트된 todos)
-        if "todos" in result:
-            state["todos"] = result["todos"]
+        summary = {
+            "completed": result.get("completed", 0),
+            "failed": result.get("failed", 0),
+            "success_rate": result.get("success_rate", 0.0)
+        }
 
         # ===== History 기록 =====
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
         # Execute Layer의 action_history 가져오기 (있으면)
         execute_history = result.get("action_history", [])
 
         # Octostrator의 action_history에 추가
-        state["action_history"] = [{
+        action_history = [{
             "action": "execute_layer_node_wrapper",
-            "result": {
-                "completed": state["completed"],
-                "failed": state["failed"],
-                "success_rate": state["success_rate"]
-            },
+            "result": summary,
             "duration_ms": duration_ms,
             "sub_actions": execute_history  # Execute Layer의 상세 history
         }]
 
-        state["updated_at"] = end_time.isoformat()
-        state["total_steps"] = len(state.get("action_history", []))
+        # State 갱신은 한 번에 반영
+        updates = {
+            "execution_results": result.get("execution_results", {}),
+            **summary,
+            "action_history": action_history,
+            "updated_at": end_time.isoformat(),
+            "total_steps": len(action_history)
+        }
+
+        # Todos 업데이트 (execute_impl이 반환한 업데이트된 todos)
+        if "todos" in result:
+            updates["todos"] = result["todos"]
+
+        state.update(updates)
 
         logger.info(
             f"[Octostrator] Execute Layer complete (Phase 1). "
@@ -376,22 +386,24 @@ async def execute_layer_node(
     except Exception as e:
         logger.error(f"[Octostrator] Execute Layer failed: {e}", exc_info=True)
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
-        state["error"] = str(e)
-        state["execution_results"] = {}
-        state["completed"] = 0
-        state["failed"] = 0
-        state["success_rate"] = 0.0
+        state.update({
+            "error": str(e),
+            "execution_results": {},
+            "completed": 0,
+            "failed": 0,
+            "success_rate": 0.0,
 
-        # 에러도 history에 기록
-        state["action_history"] = [{
-            "action": "execute_layer_node_wrapper",
-            "result": {"error": str(e)},
-            "duration_ms": duration_ms
-        }]
+            # 에러도 history에 기록
+            "action_history": [{
+                "action": "execute_layer_node_wrapper",
+                "result": {"error": str(e)},
+                "duration_ms": duration_ms
+            }],
 
-        state["updated_at"] = end_time.isoformat()
+            "updated_at": end_time.isoformat()
+        })
 
         return state
 
@@ -416,14 +428,11 @@ async def response_layer_node(
     Returns:
         Updated state with final response and history
     """
-    start_time = datetime.now()
+    started = time.perf_counter()  # 소요 시간 측정용 (monotonic)
     logger.info("[Octostrator] Executing Response Layer")
 
     try:
-        from ..response.response_graph import build_response_graph
-
-        # Build response graph
-        response_graph = build_response_graph()
+        from ..response.response_graph import get_response_graph
 
         # Prepare response state
         response_state = {
@@ -433,25 +442,35 @@ async def response_layer_node(
             "requires_approval": state.get("requires_approval", False)
         }
 
+        # Response graph (프로세스당 한 번만 컴파일)
+        # 승인이 필요 없으면 HITL 노드가 없는 graph를 사용
+        response_graph = get_response_graph(
+            include_hitl=bool(response_state["requires_approval"])
+        )
+
         # Execute response generation
         result = await response_graph.ainvoke(response_state)
 
-        # Update state with final response
-        state["final_response"] = result.get("final_response", "")
-        state["response_format"] = result.get("selected_format", "chat")
+        response_format = result.get("selected_format", "chat")
 
         # ===== History 기록 (신규) =====
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
-        state["action_history"] = [{
+        action_history = [{
             "action": "response_layer_node",
-            "result": {"format": state["response_format"]},
+            "result": {"format": response_format},
             "duration_ms": duration_ms
         }]
 
-        state["updated_at"] = end_time.isoformat()
-        state["total_steps"] = len(state.get("action_history", []))
+        # Update state with final response (한 번에 반영)
+        state.update({
+            "final_response": result.get("final_response", ""),
+            "response_format": response_format,
+            "action_history": action_history,
+            "updated_at": end_time.isoformat(),
+            "total_steps": len(action_history)
+        })
 
         logger.info(
             f"[Octostrator] Response Layer complete. "
@@ -463,18 +482,20 @@ async def response_layer_node(
     except Exception as e:
         logger.error(f"[Octostrator] Response Layer failed: {e}")
         end_time = datetime.now()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = int((time.perf_counter() - started) * 1000)
 
-        state["error"] = str(e)
-        state["final_response"] = f"Error generating response: {e}"
+        state.update({
+            "error": str(e),
+            "final_response": f"Error generating response: {e}",
 
-        # 에러도 history에 기록
-        state["action_history"] = [{
-            "action": "response_layer_node",
-            "result": {"error": str(e)},
-            "duration_ms": duration_ms
-        }]
+            # 에러도 history에 기록
+            "action_history": [{
+                "action": "response_layer_node",
+                "result": {"error": str(e)},
+                "duration_ms": duration_ms
+            }],
 
-        state["updated_at"] = end_time.isoformat()
+            "updated_at": end_time.isoformat()
+        })
 
         return state
@@ -25,7 +25,7 @@ from .response_helpers import (
     ReportGenerator,
     ResponseFormatter
 )
-from .response_graph import build_response_graph
+from .response_graph import build_response_graph, get_response_graph
 
 __all__ = [
     # Nodes
@@ -42,5 +42,6 @@ __all__ = [
     "ResponseFormatter",
 
     # Graph
-    "build_response_graph"
+    "build_response_graph",
+    "get_response_graph"
 ]
\ No newline at end of file
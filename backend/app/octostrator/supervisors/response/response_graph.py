@@ -8,6 +8,8 @@ Date: 2025-11-05
 Version: 1.0
 """
 
+from functools import lru_cache
+
 from langgraph.graph import StateGraph, START, END
 from .response_nodes import (
     hitl_handler_node,
@@ -18,7 +20,7 @@ from .response_nodes import (
 )
 
 
-def build_response_graph(state_class=None):
+def build_response_graph(state_class=None, include_hitl: bool = True):
     """
     Build the response layer workflow graph.
 
@@ -26,6 +28,11 @@ def build_response_graph(state_class=None):
     1. HITL check (if needed)
     2. Route to output format
     3. Generate response
+
+    Args:
+        state_class: Graph state class (default: dict)
+        include_hitl: False면 HITL 노드 없이 START → router로 바로 연결
+                      (승인이 필요 없는 요청용 축소 graph)
     """
     # Use default dict if no state class provided
     if state_class is None:
@@ -35,15 +42,19 @@ def build_response_graph(state_class=None):
     graph = StateGraph(state_class)
 
     # Add nodes
-    graph.add_node("hitl", hitl_handler_node)
+    if include_hitl:
+        graph.add_node("hitl", hitl_handler_node)
     graph.add_node("router", output_router_node)
     graph.add_node("chat_gen", chat_generator_node)
     graph.add_node("graph_gen", graph_generator_node)
     graph.add_node("report_gen", report_generator_node)
 
     # Add edges
-    graph.add_edge(START, "hitl")
-    graph.add_edge("hitl", "router")
+    if include_hitl:
+        graph.add_edge(START, "hitl")
+        graph.add_edge("hitl", "router")
+    else:
+        graph.add_edge(START, "router")
 
     # Route based on output format
     graph.add_conditional_edges(
@@ -61,4 +72,19 @@ def build_response_graph(state_class=None):
     graph.add_edge("graph_gen", END)
     graph.add_edge("report_gen", END)
 
-    return graph.compile()
\ No newline at end of file
+    return graph.compile()
+
+
+@lru_cache(maxsize=None)
+def get_response_graph(include_hitl: bool = True):
+    """
+    Get the compiled response graph (compiled once per process).
+
+    Response graph는 요청별 상태를 갖지 않으므로(checkpointer 없음)
+    매 요청마다 다시 컴파일하지 않고 하나의 컴파일 결과를 재사용합니다.
+    HITL 포함/제외 graph를 각각 한 번씩 컴파일합니다.
+
+    Args:
+        include_hitl: HITL 노드 포함 여부
+    """
+    return build_response_graph(include_hitl=include_hitl)
@@ -8,8 +8,11 @@ Date: 2025-11-05
 Version: 1.0
 """
 
+import io
 import logging
-from typing import Dict, Any, List
+from functools import cached_property
+from operator import attrgetter
+from typing import Dict, Any, Iterator, List
 import json
 
 logger = logging.getLogger(__name__)
@@ -27,39 +30,41 @@ class ChatGenerator:
         데이터를 기반으로 대화형 응답을 생성합니다.
         """
         try:
-            # Extract key information
-            total_steps = data.get("total_steps", 0)
-            completed = data.get("completed_steps", 0)
-            failed = data.get("failed_steps", 0)
+            return "\n".join(self._iter_lines(data))
 
-            # Generate response
-            response_parts = []
-
-            # Greeting
-            if completed == total_steps:
-                response_parts.append("모든 작업이 성공적으로 완료되었습니다! 🎉")
-            elif failed > 0:
-                response_parts.append("작업이 일부 완료되었으나 문제가 발생했습니다. ⚠️")
-            else:
-                response_parts.append("작업이 진행 중입니다... ⏳")
-
-            # Details
-            response_parts.append(f"\n📊 실행 결과:")
-            response_parts.append(f"• 총 작업: {total_steps}개")
-            response_parts.append(f"• 완료: {completed}개")
+        except Exception as e:
+            logger.error("[ChatGenerator] Error: %s", e)
+            return "응답 생성 중 오류가 발생했습니다."
 
-            if failed > 0:
-                response_parts.append(f"• 실패: {failed}개")
+    @staticmethod
+    def _iter_lines(data: Dict[str, Any]) -> Iterator[str]:
+        """
+        대화형 응답의 각 줄을 순서대로 생성합니다 (중간 리스트 없이 join).
+        """
+        # Extract key information
+        total_steps = data.get("total_steps", 0)
+        completed = data.get("completed_steps", 0)
+        failed = data.get("failed_steps", 0)
+
+        # Greeting
+        if completed == total_steps:
+            yield "모든 작업이 성공적으로 완료되었습니다! 🎉"
+        elif failed > 0:
+            yield "작업이 일부 완료되었으나 문제가 발생했습니다. ⚠️"
+        else:
+            yield "작업이 진행 중입니다... ⏳"
 
-            # Summary
-            if summary := data.get("summary"):
-                response_parts.append(f"\n💡 요약: {summary}")
+        # Details
+        yield "\n📊 실행 결과:"
+        yield f"• 총 작업: {total_steps}개"
+        yield f"• 완료: {completed}개"
 
-            return "\n".join(response_parts)
+        if failed > 0:
+            yield f"• 실패: {failed}개"
 
-        except Exception as e:
-            logger.error(f"[ChatGenerator] Error: {e}")
-            return "응답 생성 중 오류가 발생했습니다."
+        # Summary
+        if summary := data.get("summary"):
+            yield f"\n💡 요약: {summary}"
 
 
 class GraphGenerator:
@@ -143,7 +148,7 @@ class GraphGenerator:
             }
 
         except Exception as e:
-            logger.error(f"[GraphGenerator] Error: {e}")
+            logger.error("[GraphGenerator] Error: %s", e)
             return {"nodes": [], "edges": [], "error": str(e)}
 
 
@@ -159,52 +164,48 @@ class ReportGenerator:
         데이터를 기반으로 Markdown 보고서를 생성합니다.
         """
         try:
-            # Build report sections
-            report_parts = []
+            # Build report sections (하나의 버퍼에 순서대로 기록)
+            buf = io.StringIO()
 
             # Title
-            report_parts.append("# Execution Report")
-            report_parts.append("")
+            buf.write("# Execution Report\n\n")
 
             # Summary section
-            report_parts.append("## Executive Summary")
-            report_parts.append(f"- **Total Tasks**: {data.get('total_steps', 0)}")
-            report_parts.append(f"- **Completed**: {data.get('completed_steps', 0)}")
-            report_parts.append(f"- **Failed**: {data.get('failed_steps', 0)}")
-            report_parts.append("")
+            buf.write("## Executive Summary\n")
+            buf.write(f"- **Total Tasks**: {data.get('total_steps', 0)}\n")
+            buf.write(f"- **Completed**: {data.get('completed_steps', 0)}\n")
+            buf.write(f"- **Failed**: {data.get('failed_steps', 0)}\n\n")
 
             # Details section
             if results := data.get("results", []):
-                report_parts.append("## Task Details")
-                report_parts.append("")
-                report_parts.append("| Task | Agent | Status | Result |")
-                report_parts.append("|------|-------|--------|--------|")
+                buf.write("## Task Details\n\n")
+                buf.write("| Task | Agent | Status | Result |\n")
+                buf.write("|------|-------|--------|--------|\n")
 
                 for i, result in enumerate(results):
                     task = f"Task {i+1}"
                     agent = result.get("agent", "N/A")
                     status = result.get("status", "unknown")
                     res = result.get("result", "")[:50]  # Truncate
-                    report_parts.append(f"| {task} | {agent} | {status} | {res} |")
+                    buf.write(f"| {task} | {agent} | {status} | {res} |\n")
 
-                report_parts.append("")
+                buf.write("\n")
 
             # Recommendations
-            report_parts.append("## Recommendations")
+            buf.write("## Recommendations\n")
             if data.get("failed_steps", 0) > 0:
-                report_parts.append("- Review and retry failed tasks")
-            report_parts.append("- Monitor system performance")
-            report_parts.append("- Consider optimization opportunities")
-            report_parts.append("")
+                buf.write("- Review and retry failed tasks\n")
+            buf.write("- Monitor system performance\n")
+            buf.write("- Consider optimization opportunities\n\n")
 
             # Footer
-            report_parts.append("---")
-            report_parts.append(f"*Generated at: {context.get('timestamp', 'N/A')}*")
+            buf.write("---\n")
+            buf.write(f"*Generated at: {context.get('timestamp', 'N/A')}*")
 
-            return "\n".join(report_parts)
+            return buf.getvalue()
 
         except Exception as e:
-            logger.error(f"[ReportGenerator] Error: {e}")
+            logger.error("[ReportGenerator] Error: %s", e)
             return "# Error\n\nFailed to generate report."
 
 
@@ -215,21 +216,33 @@ class ResponseFormatter:
     최종 응답을 적절한 형식으로 포맷팅합니다.
     """
 
-    def __init__(self):
-        self.chat_gen = ChatGenerator()
-        self.graph_gen = GraphGenerator()
-        self.report_gen = ReportGenerator()
+    # format_type → generator 조회 (if/elif 체인 대신 한 번의 dict 조회)
+    _GENERATORS = {
+        "chat": attrgetter("chat_gen"),
+        "graph": attrgetter("graph_gen"),
+        "report": attrgetter("report_gen")
+    }
+
+    # 요청마다 한 가지 형식만 사용하므로 각 generator는 처음 사용할 때 생성
+    @cached_property
+    def chat_gen(self) -> ChatGenerator:
+        return ChatGenerator()
+
+    @cached_property
+    def graph_gen(self) -> GraphGenerator:
+        return GraphGenerator()
+
+    @cached_property
+    def report_gen(self) -> ReportGenerator:
+        return ReportGenerator()
 
     def format(self, data: Dict[str, Any], format_type: str = "chat", context: Dict[str, Any] = None) -> Any:
         """
         데이터를 지정된 형식으로 포맷팅합니다.
         """
-        if format_type == "chat":
-            return self.chat_gen.generate(data, context)
-        elif format_type == "graph":
-            return self.graph_gen.generate(data, context)
-        elif format_type == "report":
-            return self.report_gen.generate(data, context)
-        else:
+        get_generator = self._GENERATORS.get(format_type)
+        if get_generator is None:
             # Default to JSON
-            return json.dumps(data, ensure_ascii=False, indent=2)
\ No newline at end of file
+            return json.dumps(data, ensure_ascii=False, indent=2)
+
+        return get_generator(self).generate(data, context)
\ No newline at end of file
@@ -47,7 +47,7 @@ async def hitl_handler_node(state: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"[HITL] Error: {e}")
+        logger.error("[HITL] Error: %s", e)
         return {"error": str(e)}
 
 
@@ -66,7 +66,7 @@ async def output_router_node(state: Dict[str, Any]) -> Dict[str, Any]:
         output_format = state.get("output_format", "chat")
         aggregated_data = state.get("aggregated_data", {})
 
-        logger.info(f"[Router] Routing to {output_format} generator")
+        logger.info("[Router] Routing to %s generator", output_format)
 
         return {
             "selected_format": output_format,
@@ -74,7 +74,7 @@ async def output_router_node(state: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"[Router] Error: {e}")
+        logger.error("[Router] Error: %s", e)
         return {"error": str(e)}
 
 
@@ -114,7 +114,7 @@ async def chat_generator_node(state: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"[ChatGen] Error: {e}")
+        logger.error("[ChatGen] Error: %s", e)
         return {"error": str(e)}
 
 
@@ -157,7 +157,7 @@ async def graph_generator_node(state: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"[GraphGen] Error: {e}")
+        logger.error("[GraphGen] Error: %s", e)
         return {"error": str(e)}
 
 
@@ -205,5 +205,5 @@ async def report_generator_node(state: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"[ReportGen] Error: {e}")
+        logger.error("[ReportGen] Error: %s", e)
         return {"error": str(e)}
\ No newline at end of file
@@ -4,11 +4,14 @@ TODO 관리와 Human-in-the-Loop (HITL)을 담당하는 Agent
 계획을 TODO로 변환하고 사용자 승인을 처리합니다.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Literal
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Literal, Tuple
 from datetime import datetime
-import uuid
+import time
 import json
+import re
 
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 from langgraph.graph import StateGraph, END, START
@@ -19,9 +22,22 @@ from pydantic import BaseModel, Field
 from ...execution_agents.base.base_agent import BaseAgent, AgentStatus
 from ...execution_agents.base.agent_registry import register_agent
 from ...execution_agents.base.capabilities import Capability
+from backend.app.utils.id_pool import pool_hex
 
 logger = logging.getLogger(__name__)
 
+# estimated_time이 없거나 해석할 수 없는 TODO의 기본 예상 시간 (분)
+DEFAULT_TODO_MINUTES = 2.0
+
+# "5 minutes", "1 hour", "30s", "2시간" 등에서 숫자와 단위 추출 (단위가 없으면 분)
+_DURATION_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(hours?|hrs?|h|minutes?|mins?|m|seconds?|secs?|s|시간|분|초)?",
+    re.IGNORECASE
+)
+
+# 단위 첫 글자 -> 분 환산 배수
+_UNIT_MINUTES = {"h": 60.0, "시": 60.0, "m": 1.0, "분": 1.0, "s": 1 / 60, "초": 1 / 60}
+
 
 # ====================================
 # State Import
@@ -176,12 +192,13 @@ class TodoAgent(BaseAgent):
             # LLM 가져오기 (Phase 1: Agent 선택용)
             llm = self.llm or ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
 
-            for i, step in enumerate(plan.get("steps", [])):
-                # ⭐ LLM으로 Agent 선택 (Phase 1 통합)
-                agent_name = await select_agent_for_task(step, llm=llm)
+            # ⭐ LLM으로 Agent 선택 (Phase 1 통합) - 모든 step을 동시에 라우팅
+            steps = plan.get("steps", [])
+            agent_names = await select_agents_for_steps(steps, llm=llm)
 
+            for step, agent_name in zip(steps, agent_names):
                 todo = {
-                    "id": step.get("step_id", f"todo_{uuid.uuid4().hex[:8]}"),
+                    "id": step.get("step_id", f"todo_{pool_hex(4)}"),
                     "agent": agent_name,  # ✅ 동적 할당
                     "task": step.get("action", "process"),
                     "capability": step.get("capability", "general"),
@@ -218,12 +235,8 @@ class TodoAgent(BaseAgent):
         try:
             todos = state.todos
 
-            # 의존성 그래프 생성
-            dependency_graph = {}
-            for todo in todos:
-                todo_id = todo["id"]
-                deps = todo.get("dependencies", [])
-                dependency_graph[todo_id] = deps
+            # 의존성 그래프 생성 (자기 의존성/존재하지 않는 의존성은 제거)
+            dependency_graph = self._build_dependency_graph(todos)
 
             # 순환 의존성 검사
             cycles = self._detect_cycles(dependency_graph)
@@ -262,7 +275,8 @@ class TodoAgent(BaseAgent):
             approval_request = {
                 "type": "todo_approval_request",
                 "session_id": state.user_context.get("session_id"),
-                "todos": state.todos,
+                # TODO 본문은 state.todos에 있으므로 ID만 보관 (checkpoint 중복 저장 방지)
+                "todo_ids": [todo["id"] for todo in state.todos],
                 "plan_goal": state.plan.get("goal", "Unknown goal"),
                 "total_todos": len(state.todos),
                 "estimated_time": self._calculate_total_time(state.todos),
@@ -354,7 +368,7 @@ class TodoAgent(BaseAgent):
             for todo in todos:
                 # ID 확인
                 if "id" not in todo:
-                    todo["id"] = f"todo_{uuid.uuid4().hex[:8]}"
+                    todo["id"] = f"todo_{pool_hex(4)}"
 
                 # 상태 초기화
                 todo["status"] = "pending"
@@ -468,33 +482,64 @@ class TodoAgent(BaseAgent):
 
         return {"valid": len(errors) == 0, "errors": errors}
 
+    def _build_dependency_graph(self, todos: List[Dict]) -> Dict[str, List[str]]:
+        """의존성 그래프 생성 (단일 패스 검증)
+
+        자기 자신에 대한 의존성과 존재하지 않는 TODO에 대한 의존성은
+        실행 레벨 계산을 막으므로 그래프 생성과 동시에 제거합니다.
+        """
+        todo_ids = {todo["id"] for todo in todos}
+        graph = {}
+
+        for todo in todos:
+            todo_id = todo["id"]
+            deps = todo.get("dependencies", [])
+            valid_deps = [dep for dep in deps if dep != todo_id and dep in todo_ids]
+
+            if len(valid_deps) != len(deps):
+                invalid_deps = [dep for dep in deps if dep not in valid_deps]
+                logger.warning(f"[TodoAgent] Dropping invalid dependencies of {todo_id}: {invalid_deps}")
+                todo["dependencies"] = valid_deps
+
+            graph[todo_id] = valid_deps
+
+        return graph
+
     def _detect_cycles(self, graph: Dict[str, List[str]]) -> List[List[str]]:
-        """순환 의존성 감지"""
+        """순환 의존성 감지 (반복형 DFS, WHITE/GRAY/BLACK 색칠)
+
+        GRAY 노드로 되돌아가는 모든 간선을 순환으로 보고합니다.
+        각 순환은 [순환 시작 노드, ..., 순환을 닫는 노드] 형태입니다.
+        """
+        white, gray, black = 0, 1, 2
+        color = dict.fromkeys(graph, white)
         cycles = []
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node, path):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor, path.copy()):
-                        return True
-                elif neighbor in rec_stack:
-                    # 순환 발견
-                    cycle_start = path.index(neighbor)
-                    cycles.append(path[cycle_start:])
-                    return True
+        exhausted = object()
+
+        for root in graph:
+            if color[root] != white:
+                continue
+
+            color[root] = gray
+            path = [root]
+            stack = [iter(graph[root])]
 
-            rec_stack.remove(node)
-            return False
+            while stack:
+                neighbor = next(stack[-1], exhausted)
 
-        for node in graph:
-            if node not in visited:
-                dfs(node, [])
+                if neighbor is exhausted:
+                    color[path.pop()] = black
+                    stack.pop()
+                    continue
+
+                neighbor_color = color.get(neighbor, black)  # 그래프 밖 노드는 무시
+                if neighbor_color == white:
+                    color[neighbor] = gray
+                    path.append(neighbor)
+                    stack.append(iter(graph.get(neighbor, [])))
+                elif neighbor_color == gray:
+                    # 순환 발견
+                    cycles.append(path[path.index(neighbor):])
 
         return cycles
 
@@ -514,29 +559,36 @@ class TodoAgent(BaseAgent):
         return todos
 
     def _calculate_execution_levels(self, todos: List[Dict]) -> List[List[str]]:
-        """실행 레벨 계산 (병렬 실행 가능 그룹)"""
+        """실행 레벨 계산 (병렬 실행 가능 그룹)
+
+        Kahn's Algorithm을 레벨 단위로 수행합니다 (O(V + E)).
+        순환 등으로 진행할 수 없는 TODO는 레벨에 포함되지 않습니다.
+        """
+        in_degree = {}
+        dependents: Dict[str, List[str]] = {}
+        for todo in todos:
+            deps = todo.get("dependencies", [])
+            in_degree[todo["id"]] = len(deps)
+            for dep in deps:
+                dependents.setdefault(dep, []).append(todo["id"])
+
+        # 각 레벨은 원래 TODO 순서를 유지 (발견 순서와 무관하게 결정적)
+        position = {todo["id"]: index for index, todo in enumerate(todos)}
+        level = [todo["id"] for todo in todos if in_degree[todo["id"]] == 0]
         levels = []
-        completed = set()
-        todo_map = {t["id"]: t for t in todos}
 
-        while len(completed) < len(todos):
-            level = []
-
-            for todo in todos:
-                if todo["id"] in completed:
-                    continue
+        while level:
+            levels.append(level)
+            next_level = []
 
-                # 모든 의존성이 완료되었는지 확인
-                deps = todo.get("dependencies", [])
-                if all(d in completed for d in deps):
-                    level.append(todo["id"])
+            for todo_id in level:
+                for dependent in dependents.get(todo_id, []):
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_level.append(dependent)
 
-            if not level:
-                # 더 이상 진행할 수 없음
-                break
-
-            levels.append(level)
-            completed.update(level)
+            next_level.sort(key=position.__getitem__)
+            level = next_level
 
         return levels
 
@@ -545,10 +597,45 @@ class TodoAgent(BaseAgent):
         return self._calculate_execution_levels(todos)
 
     def _calculate_total_time(self, todos: List[Dict]) -> str:
-        """총 예상 시간 계산"""
-        # 간단한 구현 (실제로는 더 복잡한 로직 필요)
-        total_minutes = len(todos) * 2  # 각 TODO당 평균 2분
-        return f"{total_minutes} minutes"
+        """총 예상 시간 계산 (의존성 그래프의 critical path)
+
+        같은 레벨의 TODO는 병렬 실행되므로, 총 시간은 의존성 체인 중
+        가장 긴 경로의 예상 시간 합입니다.
+        """
+        todo_map = {todo["id"]: todo for todo in todos}
+        finish_times: Dict[str, float] = {}
+
+        # 레벨 순서 = 위상 정렬 순서 (의존성의 완료 시각이 항상 먼저 계산됨)
+        for level in self._calculate_execution_levels(todos):
+            for todo_id in level:
+                todo = todo_map[todo_id]
+                start_time = max(
+                    (finish_times[dep] for dep in todo.get("dependencies", [])),
+                    default=0.0
+                )
+                finish_times[todo_id] = start_time + self._estimate_minutes(todo)
+
+        total_minutes = max(finish_times.values(), default=0.0)
+        return f"{total_minutes:g} minutes"
+
+    def _estimate_minutes(self, todo: Dict) -> float:
+        """TODO 예상 시간(분) 해석
+
+        숫자는 분 단위로 보고, 문자열은 "5 minutes", "1 hour", "30s"처럼
+        단위를 해석해 분으로 환산합니다.
+        """
+        estimated = todo.get("estimated_time")
+
+        if isinstance(estimated, (int, float)):
+            return float(estimated)
+
+        if isinstance(estimated, str):
+            match = _DURATION_PATTERN.search(estimated)
+            if match:
+                value, unit = match.groups()
+                return float(value) * _UNIT_MINUTES[unit[0].lower()] if unit else float(value)
+
+        return DEFAULT_TODO_MINUTES
 
     async def _optimize_todos_with_llm(
         self,
@@ -564,6 +651,117 @@ class TodoAgent(BaseAgent):
 # AGENT SELECTION (Phase 1 통합)
 # ====================================
 
+# Agent 라우팅 프롬프트 템플릿
+# 고정된 Agent 목록을 앞에 두고 task 설명만 끝에서 치환 (매 호출 동일한 prefix)
+AGENT_ROUTER_PROMPT = """You are an AI agent router. Given a task description, select the most appropriate agent.
+
+Available agents:
+- frontdesk_agent: 신규 리드 관리, 상담 예약, 문의 응대, 고객 정보 수집
+- assessor_agent: 체성분 분석(InBody), 자세 평가, 피트니스 점수 계산
+- program_designer_agent: 운동 프로그램 설계, 식단 프로그램 작성
+- manager_agent: 회원 출석 관리, 이탈 위험 분석, PT 세션 관리
+- marketing_agent: SNS 콘텐츠 생성, 이벤트 기획, 마케팅 캠페인
+- owner_assistant_agent: 매출 분석, 트레이너 성과 분석, 비즈니스 리포트
+- trainer_education_agent: 트레이너 교육 자료 생성, 스킬 평가
+
+Task: {task_description}
+
+Return ONLY the agent name (e.g., "frontdesk_agent"), nothing else."""
+
+# 라우팅 결과로 허용되는 Agent (불변 상수, 호출마다 재생성하지 않음)
+VALID_AGENTS = frozenset({
+    "frontdesk_agent",
+    "assessor_agent",
+    "program_designer_agent",
+    "manager_agent",
+    "marketing_agent",
+    "owner_assistant_agent",
+    "trainer_education_agent",
+})
+
+# Agent 선택 결과 캐시 (정규화된 task 설명 → (만료 시각, agent))
+# 같은 설명의 step은 LLM 라우팅 결과가 같으므로 반복 호출을 생략
+AGENT_SELECTION_CACHE_MAXSIZE = 512
+AGENT_SELECTION_CACHE_TTL = 3600  # 1시간
+
+_agent_selection_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def _normalize_task_description(task_description: str) -> str:
+    """캐시 키용 task 설명 정규화 (공백/대소문자 차이 무시)"""
+    return " ".join(task_description.split()).lower()
+
+
+def _get_cached_agent(cache_key: str) -> Optional[str]:
+    """캐시된 Agent 선택 결과 조회 (만료된 항목은 제거)"""
+    entry = _agent_selection_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    expires_at, agent_name = entry
+    if expires_at <= time.monotonic():
+        del _agent_selection_cache[cache_key]
+        return None
+
+    _agent_selection_cache.move_to_end(cache_key)
+    return agent_name
+
+
+def _cache_agent(cache_key: str, agent_name: str):
+    """Agent 선택 결과 캐싱 (LRU)"""
+    _agent_selection_cache[cache_key] = (time.monotonic() + AGENT_SELECTION_CACHE_TTL, agent_name)
+    _agent_selection_cache.move_to_end(cache_key)
+    if len(_agent_selection_cache) > AGENT_SELECTION_CACHE_MAXSIZE:
+        _agent_selection_cache.popitem(last=False)
+
+
+def clear_agent_selection_cache():
+    """Agent 선택 캐시 초기화 (Agent 구성 변경 시 호출)"""
+    _agent_selection_cache.clear()
+
+
+# 동시에 진행하는 Agent 선택 LLM 호출 수 상한 (rate limit 보호)
+AGENT_SELECTION_CONCURRENCY = 8
+
+
+def _explicit_agent(step: dict) -> Optional[str]:
+    """Plan step에 이미 지정된 유효한 Agent 반환 (없으면 None)"""
+    agent_name = step.get("agent")
+    return agent_name if agent_name in VALID_AGENTS else None
+
+
+async def select_agents_for_steps(steps: List[dict], llm) -> List[str]:
+    """여러 step의 Agent를 동시에 선택
+
+    step별 LLM 라우팅 호출을 동시 실행 상한 안에서 병렬로 수행하고,
+    같은 task 설명을 가진 step은 하나의 호출 결과를 공유합니다.
+
+    Args:
+        steps: Plan step 목록
+        llm: Agent 선택에 사용할 LLM
+
+    Returns:
+        step 순서와 같은 순서의 Agent ID 목록
+    """
+    semaphore = asyncio.Semaphore(AGENT_SELECTION_CONCURRENCY)
+
+    async def select(step: dict) -> str:
+        async with semaphore:
+            return await select_agent_for_task(step, llm=llm)
+
+    # 동일 설명 step은 같은 Task를 공유 (in-flight 중복 호출 방지)
+    in_flight: Dict[Tuple[Optional[str], str], asyncio.Task] = {}
+    selections = []
+    for step in steps:
+        task_description = step.get("description", "") or step.get("action", "")
+        cache_key = (_explicit_agent(step), _normalize_task_description(task_description))
+        if cache_key not in in_flight:
+            in_flight[cache_key] = asyncio.ensure_future(select(step))
+        selections.append(in_flight[cache_key])
+
+    return list(await asyncio.gather(*selections))
+
+
 async def select_agent_for_task(step: dict, llm) -> str:
     """
     Task를 분석하여 적절한 Agent 선택 (LLM 기반)
@@ -586,10 +784,11 @@ async def select_agent_for_task(step: dict, llm) -> str:
     ## Step 1: Agent Registry에서 동적으로 Agent 목록 가져오기
 
     ```python
-    from backend.app.octostrator.execution_agents import agent_registry
+    from backend.app.octostrator.execution_agents import get_agent_registry
 
-    # 등록된 모든 Agent 조회
-    available_agents = agent_registry.list_agents()
+    # 등록된 모든 Agent 조회 (현재 스코프의 Registry)
+    registry = get_agent_registry()
+    available_agents = registry.list_agents()
 
     if not available_agents:
         logger.warning("[TodoManager] No agents registered")
@@ -598,7 +797,7 @@ async def select_agent_for_task(step: dict, llm) -> str:
     # Agent 정보 수집
     agents_info = []
     for agent_id in available_agents:
-        agent = agent_registry.get_agent_instance(agent_id)
+        agent = registry.get_agent_instance(agent_id)
         if agent:
             agents_info.append({
                 "id": agent_id,
@@ -683,7 +882,7 @@ async def select_agent_for_task(step: dict, llm) -> str:
     현재 하드코딩을 동적 탐색으로 전환하려면:
 
     - [ ] Line 594-608: LLM 프롬프트를 동적 생성으로 변경
-    - [ ] Line 615-623: valid_agents 리스트를 agent_registry.list_agents()로 대체
+    - [ ] Line 615-623: valid_agents 리스트를 get_agent_registry().list_agents()로 대체
     - [ ] Line 625-630: Fallback 로직 개선 (Agent 없을 때 None 반환)
     - [ ] Line 590-591: 기본 Agent fallback 제거
     - [ ] 테스트 시나리오:
@@ -734,49 +933,40 @@ async def select_agent_for_task(step: dict, llm) -> str:
     """
     task_description = step.get("description", "") or step.get("action", "")
 
+    # Planner가 유효한 Agent를 이미 지정한 step은 LLM 라우팅 생략
+    explicit_agent = _explicit_agent(step)
+    if explicit_agent:
+        logger.debug("[TodoManager] Using planned agent %s (routing skipped)", explicit_agent)
+        return explicit_agent
+
     if not task_description:
         logger.warning("[TodoManager] Empty task description, using default agent")
         return "frontdesk_agent"
 
-    try:
-        # LLM 프롬프트
-        prompt = f"""You are an AI agent router. Given a task description, select the most appropriate agent.
+    cache_key = _normalize_task_description(task_description)
+    cached_agent = _get_cached_agent(cache_key)
+    if cached_agent:
+        logger.info(f"[TodoManager] Selected {cached_agent} for task (cached): {task_description}")
+        return cached_agent
 
-Available agents:
-- frontdesk_agent: 신규 리드 관리, 상담 예약, 문의 응대, 고객 정보 수집
-- assessor_agent: 체성분 분석(InBody), 자세 평가, 피트니스 점수 계산
-- program_designer_agent: 운동 프로그램 설계, 식단 프로그램 작성
-- manager_agent: 회원 출석 관리, 이탈 위험 분석, PT 세션 관리
-- marketing_agent: SNS 콘텐츠 생성, 이벤트 기획, 마케팅 캠페인
-- owner_assistant_agent: 매출 분석, 트레이너 성과 분석, 비즈니스 리포트
-- trainer_education_agent: 트레이너 교육 자료 생성, 스킬 평가
-
-Task: {task_description}
-
-Return ONLY the agent name (e.g., "frontdesk_agent"), nothing else."""
+    try:
+        # LLM 프롬프트 (고정 부분은 모듈 로드 시 한 번만 생성)
+        prompt = AGENT_ROUTER_PROMPT.format(task_description=task_description)
 
         # LLM 호출
         response = await llm.ainvoke([SystemMessage(content=prompt)])
         agent_name = response.content.strip().lower()
 
         # Validation: 유효한 agent인지 확인
-        valid_agents = [
-            "frontdesk_agent",
-            "assessor_agent",
-            "program_designer_agent",
-            "manager_agent",
-            "marketing_agent",
-            "owner_assistant_agent",
-            "trainer_education_agent"
-        ]
-
-        if agent_name not in valid_agents:
+        if agent_name not in VALID_AGENTS:
             logger.warning(
                 f"[TodoManager] Invalid agent '{agent_name}' returned by LLM, "
                 f"using frontdesk_agent as fallback"
             )
             return "frontdesk_agent"
 
+        _cache_agent(cache_key, agent_name)
+
         logger.info(f"[TodoManager] Selected {agent_name} for task: {task_description}")
         return agent_name
 
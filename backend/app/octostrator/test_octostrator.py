@@ -8,6 +8,7 @@ Version: 1.0
 """
 
 import asyncio
+import importlib
 import sys
 from pathlib import Path
 
@@ -20,6 +21,26 @@ if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
+# (표시 이름, 모듈 경로, import할 이름) - 항목 추가만으로 import 검사 확장
+OCTOSTRATOR_IMPORTS = (
+    (
+        "Octostrator nodes",
+        "backend.app.octostrator.supervisors.octostrator.octostrator_nodes",
+        ("cognitive_layer_node", "todo_layer_node", "execute_layer_node", "response_layer_node"),
+    ),
+    (
+        "Octostrator supervisor helper",
+        "backend.app.octostrator.supervisors.octostrator.octostrator_helpers",
+        ("OctostratorSupervisor",),
+    ),
+    (
+        "Octostrator graph builder",
+        "backend.app.octostrator.supervisors.octostrator.octostrator_graph",
+        ("build_octostrator_graph",),
+    ),
+)
+
+
 def test_imports():
     """Test if octostrator imports work"""
     print("\n" + "="*50)
@@ -30,31 +51,16 @@ def test_imports():
 
     # Test octostrator imports
     print("\nTesting octostrator imports...")
-    try:
-        from backend.app.octostrator.supervisors.octostrator.octostrator_nodes import (
-            cognitive_layer_node,
-            todo_layer_node,
-            execute_layer_node,
-            response_layer_node
-        )
-        print("   ✓ Octostrator nodes imported")
-    except ImportError as e:
-        errors.append(f"   ✗ Octostrator nodes: {e}")
-        print(errors[-1])
-
-    try:
-        from backend.app.octostrator.supervisors.octostrator.octostrator_helpers import OctostratorSupervisor
-        print("   ✓ Octostrator supervisor helper imported")
-    except ImportError as e:
-        errors.append(f"   ✗ Octostrator supervisor helper: {e}")
-        print(errors[-1])
-
-    try:
-        from backend.app.octostrator.supervisors.octostrator.octostrator_graph import build_octostrator_graph
-        print("   ✓ Octostrator graph builder imported")
-    except ImportError as e:
-        errors.append(f"   ✗ Octostrator graph builder: {e}")
-        print(errors[-1])
+    for label, module_path, names in OCTOSTRATOR_IMPORTS:
+        try:
+            module = importlib.import_module(module_path)
+            missing = [name for name in names if not hasattr(module, name)]
+            if missing:
+                raise ImportError(f"cannot import name(s) {', '.join(missing)} from '{module_path}'")
+            print(f"   ✓ {label} imported")
+        except ImportError as e:
+            errors.append(f"   ✗ {label}: {e}")
+            print(errors[-1])
 
     return errors
 
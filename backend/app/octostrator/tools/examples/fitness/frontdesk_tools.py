@@ -9,6 +9,7 @@ from backend.database.relation_db.models import Lead, Inquiry, Appointment
 from backend.database.relation_db.session import get_db
 import logging
 import json
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -328,6 +329,21 @@ async def get_available_slots(
         if start_date is None:
             start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
+        # 슬롯은 날짜별 시각(hour)으로 만들어지므로 조회 범위는 첫날 0시부터 시작
+        range_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        range_end = range_start + timedelta(days=days)
+
+        # 조회 기간의 예약된 시간을 한 번의 쿼리로 가져옴
+        with get_db() as db:
+            booked = {
+                appointment_date
+                for (appointment_date,) in db.query(Appointment.appointment_date).filter(
+                    Appointment.appointment_date >= range_start,
+                    Appointment.appointment_date < range_end,
+                    Appointment.status == "scheduled"
+                )
+            }
+
         # Mock 데이터: 오전 10시~오후 8시, 1시간 단위
         available_slots = []
 
@@ -342,18 +358,12 @@ async def get_available_slots(
                 slot_time = current_date.replace(hour=hour, minute=0)
 
                 # 이미 예약된 시간 체크
-                with get_db() as db:
-                    existing = db.query(Appointment).filter(
-                        Appointment.appointment_date == slot_time,
-                        Appointment.status == "scheduled"
-                    ).first()
-
-                    if not existing:
-                        available_slots.append({
-                            "datetime": slot_time.isoformat(),
-                            "display": slot_time.strftime("%Y-%m-%d %H:%M"),
-                            "available": True
-                        })
+                if slot_time not in booked:
+                    available_slots.append({
+                        "datetime": slot_time.isoformat(),
+                        "display": slot_time.strftime("%Y-%m-%d %H:%M"),
+                        "available": True
+                    })
 
         return {
             "success": True,
@@ -495,6 +505,24 @@ async def send_notification(
 
 # ==================== Utility Tools ====================
 
+# 문의 의도별 키워드 (dict 순서 = 매칭 우선순위)
+INQUIRY_INTENT_KEYWORDS: Dict[str, tuple] = {
+    "pricing": ("가격", "비용", "얼마", "price", "cost"),
+    "schedule": ("시간", "스케줄", "언제", "schedule", "time"),
+    "program": ("프로그램", "운동", "다이어트", "program", "workout"),
+    "facility": ("시설", "장비", "샤워", "facility", "equipment"),
+}
+
+# 모든 의도 키워드를 의도별 named group으로 묶은 단일 정규식 (한 번의 스캔으로 매칭)
+_INQUIRY_INTENT_RE = re.compile(
+    "|".join(
+        f"(?P<{intent}>{'|'.join(map(re.escape, keywords))})"
+        for intent, keywords in INQUIRY_INTENT_KEYWORDS.items()
+    ),
+    re.IGNORECASE
+)
+
+
 async def classify_inquiry_intent(inquiry_text: str) -> Dict[str, Any]:
     """문의 내용 분류 (간단한 키워드 기반)
 
@@ -504,19 +532,12 @@ async def classify_inquiry_intent(inquiry_text: str) -> Dict[str, Any]:
     Returns:
         분류된 의도
     """
-    inquiry_lower = inquiry_text.lower()
-
-    # 간단한 키워드 매칭
-    if any(keyword in inquiry_lower for keyword in ["가격", "비용", "얼마", "price", "cost"]):
-        intent = "pricing"
-    elif any(keyword in inquiry_lower for keyword in ["시간", "스케줄", "언제", "schedule", "time"]):
-        intent = "schedule"
-    elif any(keyword in inquiry_lower for keyword in ["프로그램", "운동", "다이어트", "program", "workout"]):
-        intent = "program"
-    elif any(keyword in inquiry_lower for keyword in ["시설", "장비", "샤워", "facility", "equipment"]):
-        intent = "facility"
-    else:
-        intent = "general"
+    # 간단한 키워드 매칭 (우선순위 순서대로 첫 매칭 의도 선택)
+    matched = {match.lastgroup for match in _INQUIRY_INTENT_RE.finditer(inquiry_text)}
+    intent = next(
+        (candidate for candidate in INQUIRY_INTENT_KEYWORDS if candidate in matched),
+        "general"
+    )
 
     return {
         "success": True,
@@ -7,11 +7,15 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from backend.database.relation_db.models import Program, ExerciseDB, User
 from backend.database.relation_db.session import get_db
+from backend.app.utils.async_cache import cached_read
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
+# 운동 검색 캐시 유지 시간(초) - 운동 DB 변경이 일정 시간 후 반영되도록 제한
+EXERCISE_SEARCH_CACHE_TTL = 60
+
 
 # ==================== Program Creation Tools ====================
 
@@ -196,6 +200,7 @@ async def update_program_status(program_id: int, status: str) -> Dict[str, Any]:
 
 # ==================== Template Tools ====================
 
+@cached_read
 async def get_workout_templates() -> Dict[str, Any]:
     """사용 가능한 운동 템플릿 조회 (Mock Data)
 
@@ -303,6 +308,7 @@ async def get_workout_templates() -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+@cached_read
 async def get_diet_templates() -> Dict[str, Any]:
     """사용 가능한 식단 템플릿 조회 (Mock Data)
 
@@ -473,6 +479,7 @@ async def customize_program(
 
 # ==================== Exercise Database Tools ====================
 
+@cached_read(ttl=EXERCISE_SEARCH_CACHE_TTL)
 async def search_exercises(
     muscle_group: Optional[str] = None,
     difficulty: Optional[str] = None,
@@ -7,11 +7,23 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from backend.database.relation_db.models import TrainerSkill, User
 from backend.database.relation_db.session import get_db
+from backend.app.utils.async_cache import cached_read
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
+# 트레이너 스킬 개요 캐시 유지 시간(초) - 스킬 기록 시에는 즉시 무효화
+OVERVIEW_CACHE_TTL = 60
+
+# 신규 스킬의 카테고리 판별 키워드 (순서대로 검사, 매칭 없으면 "technique")
+SKILL_CATEGORY_KEYWORDS = (
+    ("technique", ("strength training", "movement", "form", "exercise", "assessment", "functional")),
+    ("communication", ("communication", "motivation", "coaching", "leadership", "team")),
+    ("program_design", ("programming", "periodization", "nutrition", "design")),
+    ("sales", ("sales", "retention", "marketing", "business", "client acquisition")),
+)
+
 
 # ==================== Training Modules (Mock Data) ====================
 
@@ -165,6 +177,7 @@ async def record_trainer_skill(
             )
             db.add(trainer_skill)
             db.commit()
+            get_all_trainers_overview.cache_clear()
             db.refresh(trainer_skill)
 
             logger.info(f"[Trainer Education] Skill recorded for trainer {trainer_id}: {skill_name} (Level {proficiency_level})")
@@ -286,6 +299,7 @@ async def assess_skill_level(
                 existing_skill.assessor = assessor
                 existing_skill.notes = notes
                 db.commit()
+                get_all_trainers_overview.cache_clear()
                 db.refresh(existing_skill)
 
                 logger.info(f"[Trainer Education] Skill {skill_name} updated for trainer {trainer_id}: {old_level} -> {proficiency_level}")
@@ -303,18 +317,14 @@ async def assess_skill_level(
                 }
             else:
                 # Create new skill - need to determine category
-                category_map = {
-                    "technique": ["strength training", "movement", "form", "exercise", "assessment", "functional"],
-                    "communication": ["communication", "motivation", "coaching", "leadership", "team"],
-                    "program_design": ["programming", "periodization", "nutrition", "design"],
-                    "sales": ["sales", "retention", "marketing", "business", "client acquisition"]
-                }
-
-                skill_category = "technique"  # default
-                for cat, keywords in category_map.items():
-                    if any(keyword in skill_name.lower() for keyword in keywords):
-                        skill_category = cat
-                        break
+                skill_key = skill_name.casefold()
+                skill_category = next(
+                    (
+                        cat for cat, keywords in SKILL_CATEGORY_KEYWORDS
+                        if any(keyword in skill_key for keyword in keywords)
+                    ),
+                    "technique"  # default
+                )
 
                 new_skill = TrainerSkill(
                     trainer_id=trainer_id,
@@ -327,6 +337,7 @@ async def assess_skill_level(
                 )
                 db.add(new_skill)
                 db.commit()
+                get_all_trainers_overview.cache_clear()
                 db.refresh(new_skill)
 
                 logger.info(f"[Trainer Education] New skill {skill_name} created for trainer {trainer_id}: Level {proficiency_level}")
@@ -540,6 +551,7 @@ async def create_development_plan(
 
 # ==================== Training Modules Tools ====================
 
+@cached_read
 async def get_training_modules() -> Dict[str, Any]:
     """사용 가능한 트레이너 교육 모듈 조회
 
@@ -627,6 +639,7 @@ async def track_training_progress(
 
 # ==================== Overview Tools ====================
 
+@cached_read(ttl=OVERVIEW_CACHE_TTL)
 async def get_all_trainers_overview() -> Dict[str, Any]:
     """모든 트레이너의 스킬 개요 조회
 
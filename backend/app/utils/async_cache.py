@@ -0,0 +1,84 @@
+"""Async Result Cache
+
+읽기 전용 async Tool 결과를 프로세스 내에서 재사용하기 위한 데코레이터
+"""
+
+import copy
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+def _purge_expired(cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]", now: float) -> None:
+    """만료된 캐시 항목 일괄 제거 (다시 조회되지 않는 키도 메모리에 남지 않도록)"""
+    for key in [key for key, (expires_at, _) in cache.items() if expires_at <= now]:
+        del cache[key]
+
+
+def cached_read(
+    func: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+    *,
+    ttl: Optional[float] = None,
+    maxsize: int = 128
+):
+    """읽기 전용 async Tool 결과 캐싱 데코레이터
+
+    정규화된 호출 인자를 키로 성공 응답({"success": True, ...})만 캐싱합니다.
+    호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본을 반환합니다.
+    인자 조합이 다양한 Tool도 메모리가 무한히 늘지 않도록 LRU로 maxsize개만 유지합니다.
+
+    Args:
+        func: 캐싱할 async Tool 함수
+        ttl: 캐시 유지 시간(초). None이면 cache_clear() 전까지 유지.
+            새 항목을 저장할 때 만료된 항목을 모두 제거합니다.
+        maxsize: 최대 캐시 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+
+    Usage:
+        @cached_read
+        async def get_workout_templates() -> Dict[str, Any]:
+            ...
+
+        @cached_read(ttl=60)
+        async def get_all_trainers_overview() -> Dict[str, Any]:
+            ...
+
+        get_workout_templates.cache_clear()  # 데이터 변경 시 무효화
+        get_workout_templates.cache_size()   # 현재 캐시 항목 수
+    """
+    if func is None:
+        return functools.partial(cached_read, ttl=ttl, maxsize=maxsize)
+
+    signature = inspect.signature(func)
+    # key -> (만료 시각, 결과), 최근 사용 순서 유지
+    cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        # 위치/키워드/기본값 호출이 같은 키를 갖도록 인자를 시그니처에 바인딩
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = tuple(bound.arguments.items())
+        entry = cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            cache.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
+        # 만료된 항목은 재조회 실패 시에도 남지 않도록 먼저 제거
+        cache.pop(key, None)
+        result = await func(*args, **kwargs)
+        if not result.get("success"):
+            return result
+
+        now = time.monotonic()
+        if ttl is not None:
+            _purge_expired(cache, now)
+        cache[key] = (now + ttl if ttl is not None else float("inf"), result)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    wrapper.cache_clear = cache.clear
+    wrapper.cache_size = cache.__len__
+    return wrapper
@@ -0,0 +1,79 @@
+"""Random ID Pool
+
+요청마다 생성되는 trace/thread/todo ID를 위한 난수 풀
+uuid.uuid4()는 호출마다 os.urandom(16) 시스템 콜과 UUID 객체 생성을 거치므로,
+스레드별로 난수를 한 번에 받아두고 잘라서 사용합니다.
+"""
+
+import os
+import threading
+
+# 한 번에 받아오는 난수 바이트 수
+_POOL_SIZE = 4096
+
+
+class _RandomPool:
+    """스레드 로컬 난수 버퍼"""
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self):
+        self.buf = b""
+        self.pos = 0
+
+    def take(self, n_bytes: int) -> bytes:
+        """n_bytes 만큼 난수 바이트 반환 (부족하면 새로 채움)"""
+        end = self.pos + n_bytes
+        if end > len(self.buf):
+            self.buf = os.urandom(max(_POOL_SIZE, n_bytes))
+            self.pos, end = 0, n_bytes
+        chunk = self.buf[self.pos:end]
+        self.pos = end
+        return chunk
+
+
+_local = threading.local()
+
+
+def _reset_after_fork():
+    """fork된 자식 프로세스가 부모와 같은 난수를 재사용하지 않도록 풀 폐기"""
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _pool() -> _RandomPool:
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = _RandomPool()
+    return pool
+
+
+def pool_hex(n_bytes: int) -> str:
+    """n_bytes 바이트 난수의 hex 문자열 (길이 2 * n_bytes)
+
+    uuid.uuid4().hex[:N] 대체용: pool_hex(N // 2)
+
+    Args:
+        n_bytes: 난수 바이트 수
+
+    Returns:
+        hex 문자열
+    """
+    return _pool().take(n_bytes).hex()
+
+
+def pool_uuid4() -> str:
+    """str(uuid.uuid4())와 같은 형식의 UUID v4 문자열
+
+    Returns:
+        "xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx" 형식 문자열
+    """
+    raw = bytearray(_pool().take(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
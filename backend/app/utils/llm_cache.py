@@ -0,0 +1,97 @@
+"""LLM Client Cache
+
+동일한 설정의 ChatOpenAI 인스턴스를 재사용하기 위한 팩토리
+
+ChatOpenAI의 async HTTP 클라이언트는 처음 사용한 이벤트 루프에 묶이므로
+캐시는 실행 중인 이벤트 루프별로 분리합니다.
+"""
+
+import asyncio
+import hashlib
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from langchain_openai import ChatOpenAI
+
+# 이벤트 루프별 최대 캐시 인스턴스 수
+_MAXSIZE = 16
+
+_ModelKey = Tuple[str, float, Optional[int], str]
+
+# 이벤트 루프 -> {(모델, 온도, 최대 토큰, API 키 해시): ChatOpenAI}
+_models: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[_ModelKey, ChatOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _credential_id(api_key: str) -> str:
+    """캐시 키용 API 키 식별자 (원문 키를 캐시 키로 보관하지 않음)"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _loop_cache() -> Optional["OrderedDict[_ModelKey, ChatOpenAI]"]:
+    """실행 중인 이벤트 루프의 캐시 (루프 밖에서 호출되면 None)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    cache = _models.get(loop)
+    if cache is None:
+        # 닫힌 루프의 클라이언트는 재사용할 수 없으므로 함께 정리
+        for closed in [other for other in _models if other.is_closed()]:
+            del _models[closed]
+        cache = _models[loop] = OrderedDict()
+    return cache
+
+
+def get_chat_model(
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    api_key: str
+) -> ChatOpenAI:
+    """설정별 ChatOpenAI 인스턴스 반환 (이벤트 루프별 캐싱)
+
+    ChatOpenAI는 생성 시 HTTP 클라이언트를 만들기 때문에 노드 실행마다
+    새로 생성하지 않고 같은 이벤트 루프 안에서 설정 조합별로 하나의 인스턴스를 공유합니다.
+    이벤트 루프 밖에서 호출하면 캐싱하지 않고 새로 생성합니다.
+
+    Args:
+        model: 모델 이름
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수
+        api_key: OpenAI API 키
+
+    Returns:
+        ChatOpenAI instance
+    """
+    cache = _loop_cache()
+    if cache is None:
+        return _create_chat_model(model, temperature, max_tokens, api_key)
+
+    key = (model, temperature, max_tokens, _credential_id(api_key))
+    llm = cache.get(key)
+    if llm is None:
+        llm = cache[key] = _create_chat_model(model, temperature, max_tokens, api_key)
+        while len(cache) > _MAXSIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return llm
+
+
+def _create_chat_model(
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    api_key: str
+) -> ChatOpenAI:
+    """ChatOpenAI 인스턴스 생성"""
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_key=api_key
+    )
@@ -5,6 +5,7 @@ Nutrition Agent Seed Data
 """
 
 from datetime import datetime
+from sqlalchemy import insert
 from .session import get_db
 from .models import FoodDatabase
 import logging
@@ -505,26 +506,13 @@ def seed_food_database():
                 logger.info(f"[NutritionSeed] Food database already has {existing_count} items. Skipping seed.")
                 return
 
-            # 시드 데이터 추가
-            for food_data in KOREAN_FOOD_DATA:
-                food = FoodDatabase(
-                    name=food_data["name"],
-                    name_en=food_data["name_en"],
-                    category=food_data["category"],
-                    serving_size=food_data["serving_size"],
-                    serving_unit=food_data["serving_unit"],
-                    calories_per_serving=food_data["calories_per_serving"],
-                    protein=food_data["protein"],
-                    carbs=food_data["carbs"],
-                    fat=food_data["fat"],
-                    fiber=food_data["fiber"],
-                    sodium=food_data["sodium"],
-                    sugar=food_data["sugar"],
-                    is_verified=food_data["is_verified"],
-                    source=food_data["source"],
-                    created_at=datetime.utcnow()
-                )
-                db.add(food)
+            # 시드 데이터 일괄 추가 (executemany 1회)
+            created_at = datetime.utcnow()
+            payloads = [
+                {**food_data, "created_at": created_at}
+                for food_data in KOREAN_FOOD_DATA
+            ]
+            db.execute(insert(FoodDatabase), payloads)
 
             db.commit()
 
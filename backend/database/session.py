@@ -1,7 +1,7 @@
 """Database session management for async operations"""
 import os
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Final
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
 
@@ -15,17 +15,34 @@ POSTGRES_URL = os.getenv("POSTGRES_URL")
 if not POSTGRES_URL:
     raise ValueError("POSTGRES_URL environment variable is not set")
 
-# Convert postgresql:// to postgresql+asyncpg:// for async operations
-if POSTGRES_URL.startswith("postgresql://"):
-    ASYNC_POSTGRES_URL = POSTGRES_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+# libpq-style schemes; SQLAlchemy needs an explicit async driver (and rejects "postgres://")
+_SYNC_POSTGRES_PREFIXES: Final = ("postgresql://", "postgres://")
+
+# Convert postgresql:// (or postgres://) to postgresql+asyncpg:// for async operations
+if POSTGRES_URL.startswith(_SYNC_POSTGRES_PREFIXES):
+    ASYNC_POSTGRES_URL = "postgresql+asyncpg://" + POSTGRES_URL.split("://", 1)[1]
 else:
     ASYNC_POSTGRES_URL = POSTGRES_URL
 
+# asyncpg: cache prepared statements per connection so repeated INSERT/SELECT
+# templates skip server-side parse/plan
+ASYNC_CONNECT_ARGS = (
+    {"prepared_statement_cache_size": 500, "statement_cache_size": 500}
+    if ASYNC_POSTGRES_URL.startswith("postgresql+asyncpg://")
+    else {}
+)
+
 # Create async engine
+# Pool sized for concurrent agent/tool sessions; LIFO keeps a small set of
+# connections warm, pre-ping drops stale ones, recycle avoids server-side timeouts
 engine = create_async_engine(
     ASYNC_POSTGRES_URL,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=25,
+    max_overflow=25,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    connect_args=ASYNC_CONNECT_ARGS,
     echo=False,  # Set to True for SQL query logging
 )
 
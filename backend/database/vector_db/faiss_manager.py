@@ -24,9 +24,6 @@ class FAISSManager:
         self.index = None
         self.metadata = []  # 벡터에 대응하는 메타데이터 리스트
 
-        # 디렉토리 생성
-        os.makedirs(index_path, exist_ok=True)
-
         # 기존 인덱스 로드 시도
         if self._index_exists():
             self.load()
@@ -53,8 +50,8 @@ class FAISSManager:
         if len(vectors) != len(metadata):
             raise ValueError("벡터 개수와 메타데이터 개수가 일치해야 합니다.")
 
-        # 벡터를 float32로 변환 (FAISS 요구사항)
-        vectors = vectors.astype(np.float32)
+        # 벡터를 연속 float32 배열로 변환 (FAISS 요구사항, 이미 float32면 복사 없음)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
 
         # 인덱스에 벡터 추가
         self.index.add(vectors)
@@ -76,21 +73,44 @@ class FAISSManager:
             return []
 
         # 벡터를 (1, dimension) 형태로 변환
-        query_vector = query_vector.reshape(1, -1).astype(np.float32)
+        return self.search_batch(query_vector.reshape(1, -1), top_k)[0]
 
-        # 검색 수행
-        distances, indices = self.index.search(query_vector, min(top_k, self.index.ntotal))
+    def search_batch(self, query_vectors: np.ndarray, top_k: int = 5) -> List[List[Tuple[dict, float]]]:
+        """여러 쿼리 벡터를 한 번에 검색
 
-        # 결과 반환
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.metadata):
-                results.append((self.metadata[idx], float(dist)))
+        쿼리마다 search()를 호출하지 않고 (Q, dimension) 행렬 하나로 FAISS에 전달하여
+        거리 계산을 한 번의 행렬 연산으로 처리합니다.
 
-        return results
+        Args:
+            query_vectors: numpy array (Q, dimension)
+            top_k: 쿼리별 반환할 상위 결과 개수
+
+        Returns:
+            쿼리별 (metadata, distance) 리스트
+        """
+        if self.index.ntotal == 0:
+            return [[] for _ in range(len(query_vectors))]
+
+        query_vectors = np.ascontiguousarray(query_vectors, dtype=np.float32)
+
+        # 검색 수행
+        distances, indices = self.index.search(query_vectors, min(top_k, self.index.ntotal))
+
+        # 결과 반환 (FAISS는 결과가 부족하면 -1 인덱스를 채움)
+        return [
+            [
+                (self.metadata[idx], float(dist))
+                for dist, idx in zip(row_distances, row_indices)
+                if 0 <= idx < len(self.metadata)
+            ]
+            for row_distances, row_indices in zip(distances, indices)
+        ]
 
     def save(self):
         """인덱스와 메타데이터 저장"""
+        # 디렉토리는 실제로 저장할 때만 생성 (조회 전용 사용 시 파일시스템 쓰기 없음)
+        os.makedirs(self.index_path, exist_ok=True)
+
         # FAISS 인덱스 저장
         index_file = os.path.join(self.index_path, "index.faiss")
         faiss.write_index(self.index, index_file)
@@ -6,6 +6,7 @@ Tools와 State의 DB 통합을 검증합니다.
 
 import asyncio
 import sys
+from itertools import islice
 from pathlib import Path
 
 # Add backend to path
@@ -16,6 +17,17 @@ from database import frontdesk_crud
 from database.session import get_db
 
 
+def _verify_foreign_key(row, lead):
+    """row.lead_id가 lead.id를 참조하는지 검증 (python -O 실행 시 제거됨)"""
+    assert row.lead_id == lead.id, "Foreign key mismatch"
+
+
+def _verify_int_ids(info, *keys):
+    """State dict의 ID 필드가 정수인지 검증 (python -O 실행 시 제거됨)"""
+    for key in keys:
+        assert isinstance(info[key], int), f"{key} should be int"
+
+
 async def test_full_workflow():
     """전체 workflow 시뮬레이션"""
     print("\n" + "=" * 60)
@@ -64,6 +76,7 @@ async def test_full_workflow():
 
             # Convert to dict (State format)
             lead_info = frontdesk_crud.lead_to_dict(lead)
+            _verify_int_ids(lead_info, 'lead_id')
             print(f"\n  State format (lead_info):")
             print(f"    lead_id: {lead_info['lead_id']} (type: {type(lead_info['lead_id']).__name__})")
             print(f"    score: {lead_info['score']} (type: {type(lead_info['score']).__name__})")
@@ -92,7 +105,7 @@ async def test_full_workflow():
             print(f"    Type: {inquiry.inquiry_type}")
 
             # Verify foreign key relationship
-            assert inquiry.lead_id == lead.id, "Foreign key mismatch"
+            _verify_foreign_key(inquiry, lead)
             print(f"  ✓ Foreign key relationship verified")
 
         else:
@@ -103,8 +116,9 @@ async def test_full_workflow():
         print("-" * 60)
 
         from datetime import datetime, timedelta
-        start_date = datetime.now().strftime("%Y-%m-%d")
-        end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+        now = datetime.now()
+        start_date = now.date().isoformat()
+        end_date = (now + timedelta(days=7)).date().isoformat()
 
         slots = await frontdesk_crud.get_available_appointment_slots(
             session,
@@ -115,7 +129,7 @@ async def test_full_workflow():
         print(f"  ✓ Found {len(slots)} available slots")
         if slots:
             print(f"    First 3 slots:")
-            for i, slot in enumerate(slots[:3], 1):
+            for i, slot in enumerate(islice(slots, 3), 1):
                 print(f"      {i}. {slot['date']} at {slot['time']}")
 
         # Step 5: 예약 생성
@@ -143,7 +157,7 @@ async def test_full_workflow():
                 print(f"    Type: {appointment.appointment_type}")
 
                 # Verify foreign key
-                assert appointment.lead_id == lead.id, "Foreign key mismatch"
+                _verify_foreign_key(appointment, lead)
                 print(f"  ✓ Foreign key relationship verified")
 
                 # Convert to dict (State format)
@@ -153,8 +167,7 @@ async def test_full_workflow():
                 print(f"    lead_id: {appointment_info['lead_id']} (type: {type(appointment_info['lead_id']).__name__})")
 
                 # Verify types for State schema
-                assert isinstance(appointment_info['appointment_id'], int), "appointment_id should be int"
-                assert isinstance(appointment_info['lead_id'], int), "lead_id should be int"
+                _verify_int_ids(appointment_info, 'appointment_id', 'lead_id')
                 print(f"  ✓ State schema types verified")
 
             else:
@@ -198,19 +211,25 @@ async def test_full_workflow():
         else:
             print("  ✗ Failed to update lead status")
 
-    print("\n" + "=" * 60)
-    print("WORKFLOW SIMULATION COMPLETED")
-    print("=" * 60)
-    print("\n✅ All steps executed successfully!")
-    print("\n📊 Verification Results:")
-    print("  ✓ Lead created with integer ID (PostgreSQL)")
-    print("  ✓ Inquiry linked via foreign key")
-    print("  ✓ Appointment slots queried from database")
-    print("  ✓ Appointment created with integer ID")
-    print("  ✓ State schema types match (all IDs are integers)")
-    print("  ✓ Lead history retrieval works")
-    print("  ✓ Lead status update works")
-    print("\n🎯 Frontdesk Agent DB Integration: VERIFIED")
+    sys.stdout.write("\n".join([
+        "",
+        "=" * 60,
+        "WORKFLOW SIMULATION COMPLETED",
+        "=" * 60,
+        "",
+        "✅ All steps executed successfully!",
+        "",
+        "📊 Verification Results:",
+        "  ✓ Lead created with integer ID (PostgreSQL)",
+        "  ✓ Inquiry linked via foreign key",
+        "  ✓ Appointment slots queried from database",
+        "  ✓ Appointment created with integer ID",
+        "  ✓ State schema types match (all IDs are integers)",
+        "  ✓ Lead history retrieval works",
+        "  ✓ Lead status update works",
+        "",
+        "🎯 Frontdesk Agent DB Integration: VERIFIED",
+    ]) + "\n")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ Frontdesk Agent Nodes Integration Tests
 
 import asyncio
 import sys
+import traceback
+from itertools import islice
 from pathlib import Path
 
 # Add backend to path
@@ -40,7 +42,8 @@ async def test_inquiry_handler_node():
         print(f"  Intent: {result.get('intent_classification')}")
         print(f"  Recommended Action: {result.get('recommended_action')}")
         print(f"  Urgency: {result.get('urgency_level')}")
-        print(f"  Response Preview: {result.get('response_text', '')[:100]}...")
+        response_text = result.get('response_text', '')
+        print(f"  Response Preview: {response_text if len(response_text) <= 100 else response_text[:100] + '...'}")
 
         return True, result
 
@@ -95,7 +98,6 @@ async def test_lead_scorer_node():
     except Exception as e:
         print(f"\n✗ Node execution failed!")
         print(f"  Error: {e}")
-        import traceback
         traceback.print_exc()
         return False, None
 
@@ -127,17 +129,17 @@ async def test_appointment_scheduler_node():
 
         if available_slots:
             print(f"  First 3 slots:")
-            for i, slot in enumerate(available_slots[:3], 1):
+            for i, slot in enumerate(islice(available_slots, 3), 1):
                 print(f"    {i}. {slot.get('date')} at {slot.get('time')}")
 
-        print(f"  Scheduling Message Preview: {result.get('scheduling_message', '')[:100]}...")
+        scheduling_message = result.get('scheduling_message', '')
+        print(f"  Scheduling Message Preview: {scheduling_message if len(scheduling_message) <= 100 else scheduling_message[:100] + '...'}")
 
         return True, result
 
     except Exception as e:
         print(f"\n✗ Node execution failed!")
         print(f"  Error: {e}")
-        import traceback
         traceback.print_exc()
         return False, None
 
@@ -173,7 +175,6 @@ async def test_notification_sender_node():
     except Exception as e:
         print(f"\n✗ Node execution failed!")
         print(f"  Error: {e}")
-        import traceback
         traceback.print_exc()
         return False, None
 
@@ -217,9 +218,7 @@ async def run_all_tests():
         results['notification_sender'] = None
 
     # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
+    lines = ["", "=" * 60, "TEST SUMMARY", "=" * 60]
 
     for test_name, success in results.items():
         if success is True:
@@ -229,13 +228,13 @@ async def run_all_tests():
         else:
             status = "⚠ SKIPPED"
 
-        print(f"  {test_name}: {status}")
+        lines.append(f"  {test_name}: {status}")
 
     total = len([s for s in results.values() if s is not None])
     passed = len([s for s in results.values() if s is True])
 
-    print(f"\nTotal: {passed}/{total} tests passed")
-    print("=" * 60)
+    lines.extend(["", f"Total: {passed}/{total} tests passed", "=" * 60])
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
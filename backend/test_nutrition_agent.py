@@ -5,7 +5,7 @@ Nutrition Agent Test Script
 """
 
 import asyncio
-from datetime import datetime, date
+from datetime import datetime
 from backend.app.octostrator.agents.nutrition.nutrition_agent import NutritionAgent
 from backend.database.relation_db.session import init_db
 from backend.database.relation_db.nutrition_seed_data import seed_food_database
@@ -24,12 +24,9 @@ async def test_nutrition_agent():
 
     # 테스트용 user_id
     test_user_id = 1
+    now = datetime.now()
 
-    # 1. 영양 목표 설정 테스트
-    print("\n" + "=" * 60)
-    print("1. 영양 목표 설정 테스트")
-    print("=" * 60)
-
+    # 1, 2번은 서로 의존성이 없으므로 동시에 실행
     goal_task = {
         "task_type": "set_goal",
         "user_id": test_user_id,
@@ -40,31 +37,39 @@ async def test_nutrition_agent():
             "target_carbs": 300.0,
             "target_fat": 70.0,
             "target_water": 3000,
-            "start_date": datetime.now().isoformat()
+            "start_date": now.isoformat()
         }
     }
 
-    result = await agent.process_task(goal_task, {"session_id": "test_session_1"})
-    print(f"결과: {result.get('status')}")
-    if result.get("status") == "success":
-        print(f"  - Goal Type: {result['result']['nutrition_goal'].get('goal_type')}")
-        print(f"  - Goal ID: {result['result']['nutrition_goal'].get('goal_id')}")
-
-    # 2. 음식 검색 테스트
-    print("\n" + "=" * 60)
-    print("2. 음식 검색 테스트")
-    print("=" * 60)
-
     search_task = {
         "task_type": "search_food",
         "user_id": test_user_id,
         "food_search_keyword": "닭"
     }
 
-    result = await agent.process_task(search_task, {"session_id": "test_session_2"})
-    print(f"결과: {result.get('status')}")
-    if result.get("status") == "success":
-        foods = result['result'].get('foods', [])
+    goal_result, search_result = await asyncio.gather(
+        agent.process_task(goal_task, {"session_id": "test_session_1"}),
+        agent.process_task(search_task, {"session_id": "test_session_2"})
+    )
+
+    # 1. 영양 목표 설정 테스트
+    print("\n" + "=" * 60)
+    print("1. 영양 목표 설정 테스트")
+    print("=" * 60)
+
+    print(f"결과: {goal_result.get('status')}")
+    if goal_result.get("status") == "success":
+        print(f"  - Goal Type: {goal_result['result']['nutrition_goal'].get('goal_type')}")
+        print(f"  - Goal ID: {goal_result['result']['nutrition_goal'].get('goal_id')}")
+
+    # 2. 음식 검색 테스트
+    print("\n" + "=" * 60)
+    print("2. 음식 검색 테스트")
+    print("=" * 60)
+
+    print(f"결과: {search_result.get('status')}")
+    if search_result.get("status") == "success":
+        foods = search_result['result'].get('foods', [])
         print(f"  - 검색된 음식 수: {len(foods)}")
         for food in foods[:3]:  # 상위 3개만 출력
             print(f"    • {food['name']}: {food['calories_per_serving']}kcal/{food['serving_size']}{food['serving_unit']}")
@@ -78,7 +83,7 @@ async def test_nutrition_agent():
         "task_type": "log_meal",
         "user_id": test_user_id,
         "meal_data": {
-            "date": datetime.now().isoformat(),
+            "date": now.isoformat(),
             "meal_type": "breakfast",
             "foods": [
                 {"name": "닭가슴살", "quantity": 150, "unit": "g"},
@@ -107,7 +112,7 @@ async def test_nutrition_agent():
     analysis_task = {
         "task_type": "analyze_daily",
         "user_id": test_user_id,
-        "target_date": date.today().isoformat()
+        "target_date": now.date().isoformat()
     }
 
     result = await agent.process_task(analysis_task, {"session_id": "test_session_4"})
@@ -120,28 +125,12 @@ async def test_nutrition_agent():
         print(f"  - 목표 달성률: {analysis.get('goal_achievement_rate', 0):.1%}")
         print(f"  - 품질 점수: {analysis.get('quality_score', 0):.2f}/1.0")
 
-    # 5. AI 피드백 생성 테스트
-    print("\n" + "=" * 60)
-    print("5. AI 피드백 생성 테스트")
-    print("=" * 60)
-
+    # 5, 6번은 일일 분석 이후 서로 독립적이므로 동시에 실행
     feedback_task = {
         "task_type": "get_daily_feedback",
         "user_id": test_user_id
     }
 
-    result = await agent.process_task(feedback_task, {"session_id": "test_session_5"})
-    print(f"결과: {result.get('status')}")
-    if result.get("status") == "success":
-        feedback = result['result'].get('feedback', '')
-        print(f"\n[AI 피드백]")
-        print(feedback[:500] + "..." if len(feedback) > 500 else feedback)
-
-    # 6. 식단 추천 테스트
-    print("\n" + "=" * 60)
-    print("6. 식단 추천 테스트")
-    print("=" * 60)
-
     recommend_task = {
         "task_type": "recommend_meal",
         "user_id": test_user_id,
@@ -150,15 +139,36 @@ async def test_nutrition_agent():
         }
     }
 
-    result = await agent.process_task(recommend_task, {"session_id": "test_session_6"})
-    print(f"결과: {result.get('status')}")
-    if result.get("status") == "success":
-        recommendations = result['result'].get('recommendations', [])
-        lacking = result['result'].get('lacking_nutrients', '')
+    feedback_result, recommend_result = await asyncio.gather(
+        agent.process_task(feedback_task, {"session_id": "test_session_5"}),
+        agent.process_task(recommend_task, {"session_id": "test_session_6"})
+    )
+
+    # 5. AI 피드백 생성 테스트
+    print("\n" + "=" * 60)
+    print("5. AI 피드백 생성 테스트")
+    print("=" * 60)
+
+    print(f"결과: {feedback_result.get('status')}")
+    if feedback_result.get("status") == "success":
+        feedback = feedback_result['result'].get('feedback', '')
+        print(f"\n[AI 피드백]")
+        print(feedback if len(feedback) <= 500 else feedback[:500] + "...")
+
+    # 6. 식단 추천 테스트
+    print("\n" + "=" * 60)
+    print("6. 식단 추천 테스트")
+    print("=" * 60)
+
+    print(f"결과: {recommend_result.get('status')}")
+    if recommend_result.get("status") == "success":
+        recommendations = recommend_result['result'].get('recommendations', [])
+        lacking = recommend_result['result'].get('lacking_nutrients', '')
         print(f"  - 부족한 영양소: {lacking}")
         if recommendations:
             print(f"\n[AI 추천]")
-            print(recommendations[0].get('recommendation_text', '')[:500] + "...")
+            recommendation_text = recommendations[0].get('recommendation_text', '')
+            print(recommendation_text if len(recommendation_text) <= 500 else recommendation_text[:500] + "...")
 
     print("\n" + "=" * 60)
     print("테스트 완료!")
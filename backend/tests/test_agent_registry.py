@@ -0,0 +1,187 @@
+"""AgentRegistry 테스트
+
+능력 역색인/BM25 검색/우선순위 색인/병렬 생성/scope 격리를 검증합니다.
+각 테스트는 agent_scope()로 독립 Registry를 사용하므로 전역 Registry를 건드리지 않습니다.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.octostrator.execution_agents.base import (
+    AgentPriority,
+    BaseAgent,
+    agent_registry,
+    agent_scope,
+    get_agent_registry,
+    register_agent,
+)
+
+
+class _StubAgent(BaseAgent):
+    """생성 인자로 능력/설명/우선순위를 받는 테스트용 Agent"""
+
+    def __init__(
+        self,
+        agent_id,
+        agent_name,
+        capabilities=(),
+        description="",
+        priority=AgentPriority.NORMAL
+    ):
+        super().__init__(agent_id, agent_name, description=description, priority=priority)
+        self.capabilities = list(capabilities)
+
+    def build_graph(self, llm=None):
+        return None
+
+    async def process_task(self, task, context):
+        return {}
+
+
+class _BrokenAgent(_StubAgent):
+    """생성자에서 실패하는 테스트용 Agent"""
+
+    def __init__(self, agent_id, agent_name, **kwargs):
+        raise RuntimeError("constructor failed")
+
+
+def _create(registry, agent_id, **kwargs):
+    """등록 후 인스턴스 생성"""
+    registry.register(_StubAgent, agent_id)
+    return registry.create_agent(agent_id, **kwargs)
+
+
+def test_find_agents_by_capability_intersection():
+    """모든 능력을 가진 Agent만 생성 순으로 반환"""
+    with agent_scope() as registry:
+        _create(registry, "diet_agent", capabilities=["meal_planning", "nutrition_analysis"])
+        _create(registry, "coach_agent", capabilities=["meal_planning", "workout_planning"])
+        _create(registry, "nutri_agent", capabilities=["nutrition_analysis", "meal_planning"])
+
+        assert registry.find_agents_by_capability("meal_planning") == [
+            "diet_agent", "coach_agent", "nutri_agent"
+        ]
+        assert registry.find_agents_by_capability("meal_planning", "nutrition_analysis") == [
+            "diet_agent", "nutri_agent"
+        ]
+        assert registry.find_agents_by_capability("meal_planning", "unknown") == []
+        assert registry.find_agents_by_capability() == []
+
+
+def test_search_agents_bm25_ordering():
+    """질의 토큰이 더 많이/드물게 겹치는 Agent가 먼저 반환"""
+    with agent_scope() as registry:
+        _create(
+            registry, "diet_agent",
+            capabilities=["meal_planning"],
+            description="diet meal plan and nutrition advice"
+        )
+        _create(
+            registry, "workout_agent",
+            capabilities=["workout_planning"],
+            description="workout plan and exercise routine"
+        )
+        _create(
+            registry, "report_agent",
+            capabilities=["report_generation"],
+            description="weekly progress report"
+        )
+
+        results = registry.search_agents("meal plan with nutrition")
+        assert [agent_id for agent_id, _ in results] == ["diet_agent", "workout_agent"]
+        assert results[0][1] > results[1][1] > 0
+
+        assert [agent_id for agent_id, _ in registry.search_agents("meal plan", k=1)] == ["diet_agent"]
+        assert registry.search_agents("no matching words") == []
+
+
+def test_recreate_agent_removes_stale_postings():
+    """재생성 시 이전 인스턴스의 능력/토큰/우선순위 색인 제거"""
+    with agent_scope() as registry:
+        agent = _create(
+            registry, "diet_agent",
+            capabilities=["meal_planning"],
+            description="nutrition",
+            priority=AgentPriority.HIGH
+        )
+        # 인스턴스 속성이 바뀌어도 색인 시점의 스냅샷 기준으로 제거되어야 함
+        agent.capabilities = ["something_else"]
+        agent.priority = AgentPriority.CRITICAL
+
+        registry.create_agent(
+            "diet_agent",
+            capabilities=["workout_planning"],
+            description="exercise",
+            priority=AgentPriority.LOW
+        )
+
+        assert registry.find_agents_by_capability("meal_planning") == []
+        assert registry.find_agents_by_capability("workout_planning") == ["diet_agent"]
+        assert registry.search_agents("nutrition") == []
+        assert [agent_id for agent_id, _ in registry.search_agents("exercise")] == ["diet_agent"]
+        assert registry.get_agents_by_priority(AgentPriority.HIGH) == []
+        assert registry.get_agents_by_priority(AgentPriority.LOW) == ["diet_agent"]
+        assert len(registry._priority_sorted) == 1
+
+
+def test_get_agents_by_priority():
+    """우선순위 구간별 Agent ID (ID 순)"""
+    with agent_scope() as registry:
+        _create(registry, "b_agent", priority=AgentPriority.HIGH)
+        _create(registry, "a_agent", priority=AgentPriority.HIGH)
+        _create(registry, "c_agent", priority=AgentPriority.CRITICAL)
+        _create(registry, "d_agent")
+
+        assert registry.get_agents_by_priority(AgentPriority.CRITICAL) == ["c_agent"]
+        assert registry.get_agents_by_priority(AgentPriority.HIGH) == ["a_agent", "b_agent"]
+        assert registry.get_agents_by_priority(AgentPriority.NORMAL) == ["d_agent"]
+        assert registry.get_agents_by_priority(AgentPriority.LOW) == []
+
+
+def test_create_agents_isolates_failures():
+    """병렬 생성 시 미등록/생성 실패 Agent만 None"""
+    with agent_scope() as registry:
+        registry.register(_StubAgent, "diet_agent")
+        registry.register(_StubAgent, "workout_agent")
+        registry.register(_BrokenAgent, "broken_agent")
+
+        created = asyncio.run(registry.create_agents(
+            ["diet_agent", "missing_agent", "broken_agent", "workout_agent"],
+            capabilities=["planning"]
+        ))
+
+        assert created["missing_agent"] is None
+        assert created["broken_agent"] is None
+        assert created["diet_agent"] is registry.get_agent_instance("diet_agent")
+        assert created["workout_agent"].agent_name == "Workout Agent"
+        assert registry.find_agents_by_capability("planning") == ["diet_agent", "workout_agent"]
+
+
+def test_agent_scope_isolation_and_restore():
+    """scope 안의 등록은 전역 Registry와 격리되고 종료 시 이전 Registry로 복원"""
+    outer = get_agent_registry()
+    assert outer is agent_registry
+
+    with agent_scope() as scoped:
+        assert get_agent_registry() is scoped
+        assert scoped is not agent_registry
+
+        @register_agent("scoped_agent")
+        class ScopedAgent(_StubAgent):
+            pass
+
+        assert scoped.get_agent_class("scoped_agent") is ScopedAgent
+
+        with agent_scope() as nested:
+            assert get_agent_registry() is nested
+            assert nested.list_agents() == []
+
+        assert get_agent_registry() is scoped
+
+    assert get_agent_registry() is outer
+    assert agent_registry.get_agent_class("scoped_agent") is None
@@ -0,0 +1,123 @@
+"""cached_read 데코레이터 테스트
+
+읽기 전용 Tool 결과 캐시의 키 정규화/무효화/LRU 동작을 검증합니다.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.utils.async_cache import cached_read
+
+
+def _counting_tool(**decorator_kwargs):
+    """호출 횟수를 기록하는 캐시된 Tool 생성"""
+    calls = []
+
+    @cached_read(**decorator_kwargs)
+    async def search(muscle_group=None, difficulty=None, limit=50):
+        calls.append((muscle_group, difficulty, limit))
+        return {"success": True, "muscle_group": muscle_group, "items": [1, 2]}
+
+    return search, calls
+
+
+def test_key_normalization():
+    """위치/키워드/기본값 호출은 같은 캐시 항목 사용"""
+    search, calls = _counting_tool()
+
+    async def run():
+        await search("legs")
+        await search(muscle_group="legs")
+        await search("legs", None, 50)
+        await search(limit=50, muscle_group="legs")
+        await search("chest")
+
+    asyncio.run(run())
+    assert calls == [("legs", None, 50), ("chest", None, 50)]
+
+
+def test_returns_copy():
+    """호출자가 결과를 수정해도 캐시는 오염되지 않음"""
+    search, _ = _counting_tool()
+
+    async def run():
+        first = await search("legs")
+        first["items"].append(3)
+        return await search("legs")
+
+    assert asyncio.run(run())["items"] == [1, 2]
+
+
+def test_cache_clear():
+    """cache_clear() 후에는 다시 조회"""
+    search, calls = _counting_tool()
+
+    async def run():
+        await search("legs")
+        search.cache_clear()
+        await search("legs")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_failed_results_are_not_cached():
+    """실패 응답은 캐싱하지 않음"""
+    calls = []
+
+    @cached_read
+    async def flaky():
+        calls.append(1)
+        return {"success": len(calls) > 1, "attempt": len(calls)}
+
+    async def run():
+        return [await flaky(), await flaky(), await flaky()]
+
+    results = asyncio.run(run())
+    assert [r["attempt"] for r in results] == [1, 2, 2]
+    assert len(calls) == 2
+
+
+def test_maxsize_evicts_least_recently_used():
+    """maxsize 초과 시 가장 오래 사용되지 않은 항목 제거"""
+    search, calls = _counting_tool(maxsize=2)
+
+    async def run():
+        await search("legs")
+        await search("chest")
+        await search("legs")   # legs를 최근 사용으로 갱신
+        await search("back")   # chest 제거
+        await search("legs")   # 캐시 적중
+        await search("chest")  # 다시 조회
+
+    asyncio.run(run())
+    assert [c[0] for c in calls] == ["legs", "chest", "back", "chest"]
+
+
+def test_ttl_expired_entry_is_refetched_and_purged(monkeypatch):
+    """TTL 만료 항목은 재조회되고, 다른 키 저장 시에도 제거됨"""
+    import backend.app.utils.async_cache as async_cache
+
+    now = [1000.0]
+    # 이벤트 루프가 쓰는 전역 time 모듈은 건드리지 않고 캐시 모듈의 시계만 교체
+    monkeypatch.setattr(async_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    search, calls = _counting_tool(ttl=60)
+
+    async def run():
+        await search("legs")
+        await search("chest")
+        await search("legs")   # 만료 전: 캐시 적중
+        now[0] += 61
+        await search("legs")   # 만료 후: 재조회 (chest는 만료되어 제거)
+        assert search.cache_size() == 1
+        now[0] += 30
+        await search("chest")  # 제거되었으므로 재조회
+
+    asyncio.run(run())
+    assert [c[0] for c in calls] == ["legs", "chest", "legs", "chest"]
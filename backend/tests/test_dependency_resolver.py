@@ -0,0 +1,50 @@
+"""DependencyResolver 테스트
+
+Agent 의존성 그래프의 Level 계산/위상 정렬을 검증합니다.
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app.octostrator.execution_agents.base.dependency_resolver import (
+    DependencyResolver,
+    DependencyStatus,
+)
+
+
+def test_parallel_groups_levels():
+    """의존성 Level별 병렬 그룹"""
+    resolver = DependencyResolver()
+    resolver.add_agent("a")
+    resolver.add_agent("b", ["a"])
+    resolver.add_agent("c", ["a"])
+    resolver.add_agent("d", ["b", "c"])
+
+    assert resolver.get_parallel_groups() == [["a"], ["b", "c"], ["d"]]
+    assert resolver.topological_sort() == ["a", "b", "c", "d"]
+
+
+def test_duplicate_dependency_is_not_a_cycle():
+    """같은 의존성이 중복되어도 순환으로 판정하지 않음"""
+    resolver = DependencyResolver()
+    resolver.add_agent("a")
+    resolver.add_agent("b", ["a", "a"])
+
+    status, _ = resolver.validate()
+    assert status == DependencyStatus.VALID
+    assert resolver.get_parallel_groups() == [["a"], ["b"]]
+    assert resolver.topological_sort() == ["a", "b"]
+
+
+def test_circular_dependency():
+    """순환 의존성은 None 반환"""
+    resolver = DependencyResolver()
+    resolver.add_agent("a", ["b"])
+    resolver.add_agent("b", ["a"])
+
+    assert resolver.get_parallel_groups() is None
+    assert resolver.topological_sort() is None